@@ -14,6 +14,7 @@ class ValidatorConfig(BaseModel):
     cache_enabled: bool = True
     max_file_size: int = 1048576  # 1MB
     timeout: int = 30
+    collect_suggestions: bool = True  # Run the semantic checks outside strict mode
 
 
 class EmbeddingConfig(BaseModel):
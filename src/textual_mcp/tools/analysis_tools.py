@@ -57,6 +57,7 @@ def register_analysis_tools(mcp: Any, config: TextualMCPConfig) -> None:
                         "line1": conflict.line1,
                         "line2": conflict.line2,
                         "resolution": conflict.resolution_suggestion,
+                        "exact_duplicate": conflict.exact_duplicate,
                     }
                 )
 
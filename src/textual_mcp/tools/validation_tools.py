@@ -6,8 +6,8 @@ from pathlib import Path
 from pydantic import Field
 
 from ..validators.tcss_validator import TCSSValidator
-from ..validators.inline_validator import InlineValidator
-from ..validators.selector_validator import SelectorValidator
+from ..validators.inline_validator import get_inline_validator
+from ..validators.selector_validator import get_selector_validator
 from ..config import TextualMCPConfig
 from ..utils.logging_config import log_tool_execution, log_tool_completion, get_logger
 from ..utils.errors import ToolExecutionError
@@ -18,8 +18,8 @@ def register_validation_tools(mcp: Any, config: TextualMCPConfig) -> None:
 
     # Initialize validators
     tcss_validator = TCSSValidator(config.validators)
-    inline_validator = InlineValidator()
-    selector_validator = SelectorValidator()
+    inline_validator = get_inline_validator()
+    selector_validator = get_selector_validator()
 
     logger = get_logger("validation_tools")
 
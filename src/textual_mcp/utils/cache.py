@@ -5,7 +5,7 @@ import threading
 from typing import Any, Dict, Optional, Tuple, Generic, TypeVar, Callable, cast
 from collections import OrderedDict
 from functools import wraps
-from hashlib import md5
+from hashlib import blake2b
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -119,7 +119,7 @@ def cache_key(*args: Any, **kwargs: Any) -> str:
 
     # Create hash of the key parts
     key_string = "|".join(key_parts)
-    return md5(key_string.encode()).hexdigest()
+    return blake2b(key_string.encode(), digest_size=16).hexdigest()
 
 
 class CachedFunctionWrapper(Generic[R]):
@@ -146,6 +146,8 @@ class LoggerMixin:
 def log_tool_execution(tool_name: str, parameters: Dict[str, Any]) -> None:
     """Log tool execution with parameters."""
     logger = get_logger("tools")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         "Tool execution started",
         extra={"tool_name": tool_name, "parameters": parameters, "event": "tool_start"},
@@ -157,6 +159,9 @@ def log_tool_completion(
 ) -> None:
     """Log tool completion with results."""
     logger = get_logger("tools")
+    # Skip building the record fields when this outcome's level is filtered out
+    if not logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
 
     extra = {
         "tool_name": tool_name,
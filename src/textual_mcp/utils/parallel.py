@@ -0,0 +1,46 @@
+"""Shared process pool for spreading large validation batches across CPUs."""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# Pool shared by every caller, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def usable_cpu_count() -> int:
+    """Number of CPUs this process may run on, honouring its CPU affinity."""
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get or create the shared process pool.
+
+    Returns:
+        The pool, or None when fewer than two CPUs are usable and a pool could
+        only add overhead
+    """
+    global _process_pool
+    workers = usable_cpu_count()
+    if workers < 2:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=workers)
+        return _process_pool
+
+
+def discard_process_pool() -> None:
+    """Shut down the shared pool after a failure so the next call starts a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
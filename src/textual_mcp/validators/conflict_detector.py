@@ -1,7 +1,10 @@
 """CSS conflict detection system for Textual stylesheets."""
 
-from typing import List, Dict, Any, Tuple, Optional, Set
+import re
+import sys
+from typing import List, Dict, Any, Tuple, Optional, Set, FrozenSet, NamedTuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from collections import defaultdict
 
 try:
@@ -15,9 +18,36 @@ except ImportError as e:
     raise ImportError(f"Failed to import Textual CSS components: {e}")
 
 from ..utils.logging_config import LoggerMixin
+from .tcss_validator import get_variable_tokens
 
+# Tokens of a selector, named after the parts bucket they belong to. Names run until the
+# next "." "#" ":" "[" or combinator/whitespace
+SELECTOR_PART_PATTERN = re.compile(
+    r"#(?P<ids>[^.#:\[\s>+~]*)"
+    r"|\.(?P<classes>[^.#:\[\s>+~]*)"
+    r"|::[^.#:\[\s>+~]*"
+    r"|:(?P<pseudos>[^.#:\[\s>+~]*)"
+    r"|(?P<attributes>\[[^\]\s>+~]*\])"
+    r"|(?P<types>[^.#:\[\s>+~]+)"
+)
 
-@dataclass
+# (selector1, selector2, conflicting properties, specificity1, specificity2, line1, line2)
+OverlapConflict = Tuple[
+    str, str, List[str], Tuple[int, int, int], Tuple[int, int, int], Optional[int], Optional[int]
+]
+
+
+class SelectorParts(NamedTuple):
+    """Component parts of a parsed selector."""
+
+    types: FrozenSet[str]
+    classes: FrozenSet[str]
+    ids: FrozenSet[str]
+    pseudos: FrozenSet[str]
+    attributes: FrozenSet[str]
+
+
+@dataclass(slots=True)
 class StyleConflict:
     """Represents a style conflict between CSS rules."""
 
@@ -29,9 +59,11 @@ class StyleConflict:
     line1: Optional[int] = None
     line2: Optional[int] = None
     resolution_suggestion: Optional[str] = None
+    # Set when both rules are identical blocks; no property value actually differs
+    exact_duplicate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectorOverlap:
     """Represents overlapping selectors that target the same elements."""
 
@@ -41,7 +73,7 @@ class SelectorOverlap:
     affected_elements: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictAnalysisResult:
     """Result of conflict analysis."""
 
@@ -62,9 +94,39 @@ class ConflictAnalysisResult:
         }
 
 
+@lru_cache(maxsize=4096)
+def _selector_parts(selector: str) -> SelectorParts:
+    """
+    Parse a selector into its component parts.
+
+    Overlap analysis parses each selector once per pair it is compared in, and tool
+    calls see the same selectors again, so parsed parts are cached for the process.
+    """
+    parts: Dict[str, Set[str]] = {name: set() for name in SelectorParts._fields}
+
+    # Tokenize the whole selector in one pass of the regex engine; combinators and
+    # whitespace separate compound selectors and never match a token
+    for match in SELECTOR_PART_PATTERN.finditer(selector):
+        kind = match.lastgroup
+        if kind:  # Pseudo-elements and stray brackets have no group and are skipped
+            parts[kind].add(match.group(kind))
+
+    return SelectorParts(
+        types=frozenset(parts["types"]),
+        classes=frozenset(parts["classes"]),
+        ids=frozenset(parts["ids"]),
+        pseudos=frozenset(parts["pseudos"]),
+        attributes=frozenset(parts["attributes"]),
+    )
+
+
 class SelectorOverlapAnalyzer(LoggerMixin):
     """Analyzes selector overlaps and relationships."""
 
+    def __init__(self) -> None:
+        # Specificity of every selector seen by the last find_overlapping_groups call
+        self.selector_specificity: Dict[str, Tuple[int, int, int]] = {}
+
     def analyze_overlap(self, selector1: str, selector2: str) -> Optional[str]:
         """
         Determine if and how two selectors overlap.
@@ -94,128 +156,39 @@ class SelectorOverlapAnalyzer(LoggerMixin):
 
         return None
 
-    def _parse_selector_parts(self, selector: str) -> Dict[str, Set[str]]:
+    def _parse_selector_parts(self, selector: str) -> SelectorParts:
         """Parse selector into component parts."""
-        parts: Dict[str, Set[str]] = {
-            "types": set(),
-            "classes": set(),
-            "ids": set(),
-            "pseudos": set(),
-            "attributes": set(),
-        }
+        return _selector_parts(selector)
 
-        # Handle compound selectors like Button.active
-        # Split by spaces first to get individual selector parts
-        space_parts = selector.replace(">", " ").replace("+", " ").replace("~", " ").split()
-
-        for space_part in space_parts:
-            # Now parse each compound selector
-            current_type = ""
-
-            i = 0
-            while i < len(space_part):
-                char = space_part[i]
-
-                if char == "#":
-                    # Save any accumulated type
-                    if current_type:
-                        parts["types"].add(current_type)
-                        current_type = ""
-                    # Find the end of the ID
-                    j = i + 1
-                    while j < len(space_part) and space_part[j] not in ".#:[":
-                        j += 1
-                    parts["ids"].add(space_part[i + 1 : j])
-                    i = j
-                elif char == ".":
-                    # Save any accumulated type
-                    if current_type:
-                        parts["types"].add(current_type)
-                        current_type = ""
-                    # Find the end of the class
-                    j = i + 1
-                    while j < len(space_part) and space_part[j] not in ".#:[":
-                        j += 1
-                    parts["classes"].add(space_part[i + 1 : j])
-                    i = j
-                elif char == ":":
-                    # Save any accumulated type
-                    if current_type:
-                        parts["types"].add(current_type)
-                        current_type = ""
-                    # Check if it's :: (pseudo-element) or : (pseudo-class)
-                    if i + 1 < len(space_part) and space_part[i + 1] == ":":
-                        # Pseudo-element, skip
-                        j = i + 2
-                        while j < len(space_part) and space_part[j] not in ".#:[":
-                            j += 1
-                        i = j
-                    else:
-                        # Pseudo-class
-                        j = i + 1
-                        while j < len(space_part) and space_part[j] not in ".#:[":
-                            j += 1
-                        parts["pseudos"].add(space_part[i + 1 : j])
-                        i = j
-                elif char == "[":
-                    # Save any accumulated type
-                    if current_type:
-                        parts["types"].add(current_type)
-                        current_type = ""
-                    # Find the closing bracket
-                    j = space_part.find("]", i)
-                    if j != -1:
-                        parts["attributes"].add(space_part[i : j + 1])
-                        i = j + 1
-                    else:
-                        i += 1
-                else:
-                    # Accumulate type selector
-                    current_type += char
-                    i += 1
-
-            # Don't forget the last type if any
-            if current_type:
-                parts["types"].add(current_type)
-
-        return parts
-
-    def _is_subset(self, parts1: Dict[str, Set[str]], parts2: Dict[str, Set[str]]) -> bool:
+    def _is_subset(self, parts1: SelectorParts, parts2: SelectorParts) -> bool:
         """Check if parts1 is a subset of parts2."""
         # Check if all non-empty parts1 elements are subsets of parts2
         has_content = False
-        for key in parts1:
-            if parts1[key]:
+        for own, other in zip(parts1, parts2):
+            if own:
                 has_content = True
                 # For subset relationship, all parts1 components must exist in parts2
                 # but parts2 can have additional components
-                if not parts1[key].issubset(parts2.get(key, set())):
+                if not own <= other:
                     return False
 
         # Also need to ensure parts2 has more specificity than parts1
         # e.g., "Button" is subset of "Button.active"
         if has_content:
-            parts2_has_more = False
-            for key in parts2:
-                if len(parts2[key]) > len(parts1.get(key, set())):
-                    parts2_has_more = True
-                    break
-            return parts2_has_more
+            return any(len(other) > len(own) for own, other in zip(parts1, parts2))
 
         return False
 
-    def _has_partial_overlap(
-        self, parts1: Dict[str, Set[str]], parts2: Dict[str, Set[str]]
-    ) -> bool:
+    def _has_partial_overlap(self, parts1: SelectorParts, parts2: SelectorParts) -> bool:
         """Check if selectors have partial overlap."""
         # If they share the same type selector or ID, they likely overlap
-        if parts1["types"] & parts2["types"]:
+        if parts1.types & parts2.types:
             return True
-        if parts1["ids"] & parts2["ids"]:
+        if parts1.ids & parts2.ids:
             return True
 
         # If they share multiple classes, they might overlap
-        shared_classes = parts1["classes"] & parts2["classes"]
+        shared_classes = parts1.classes & parts2.classes
         if len(shared_classes) >= 2:
             return True
 
@@ -225,6 +198,19 @@ class SelectorOverlapAnalyzer(LoggerMixin):
         """Find groups of overlapping selectors."""
         overlaps = []
         processed = set()
+        self.selector_specificity = {s: self._calculate_specificity(s) for s in selectors}
+
+        # Overlapping selectors are identical or share at least one part of the same kind,
+        # so only selectors sharing an index entry are compared instead of every pair
+        index: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        selector_keys = []
+        for position, selector in enumerate(selectors):
+            keys = [("selector", selector)]
+            for kind, tokens in zip(SelectorParts._fields, self._parse_selector_parts(selector)):
+                keys.extend((kind, token) for token in tokens)
+            for key in keys:
+                index[key].append(position)
+            selector_keys.append(keys)
 
         for i, sel1 in enumerate(selectors):
             if sel1 in processed:
@@ -232,8 +218,10 @@ class SelectorOverlapAnalyzer(LoggerMixin):
 
             overlap_group = [sel1]
             overlap_types = set()
+            candidates = sorted({j for key in selector_keys[i] for j in index[key] if j > i})
 
-            for j, sel2 in enumerate(selectors[i + 1 :], i + 1):
+            for j in candidates:
+                sel2 = selectors[j]
                 overlap_type = self.analyze_overlap(sel1, sel2)
                 if overlap_type:
                     overlap_group.append(sel2)
@@ -253,7 +241,7 @@ class SelectorOverlapAnalyzer(LoggerMixin):
                     SelectorOverlap(
                         selectors=overlap_group,
                         overlap_type=overall_type,
-                        specificity_scores=[self._calculate_specificity(s) for s in overlap_group],
+                        specificity_scores=[self.selector_specificity[s] for s in overlap_group],
                     )
                 )
 
@@ -267,13 +255,13 @@ class SelectorOverlapAnalyzer(LoggerMixin):
         parts = self._parse_selector_parts(selector)
 
         # Count IDs
-        id_count = len(parts["ids"])
+        id_count = len(parts.ids)
 
         # Count classes, attributes, and pseudo-classes
-        class_count = len(parts["classes"]) + len(parts["attributes"]) + len(parts["pseudos"])
+        class_count = len(parts.classes) + len(parts.attributes) + len(parts.pseudos)
 
         # Count type selectors
-        type_count = len(parts["types"])
+        type_count = len(parts.types)
 
         return (id_count, class_count, type_count)
 
@@ -327,6 +315,13 @@ class PropertyConflictDetector(LoggerMixin):
             "border": ["border-width", "border-style", "border-color"],
             "offset": ["offset-x", "offset-y"],
         }
+        # Shorthand names as a set, so each rule only visits the shorthands it actually uses
+        self._shorthands = frozenset(self.shorthand_expansions)
+        # Property -> group lookup; a property listed in several groups keeps its first one
+        self._property_group: Dict[str, str] = {}
+        for group, props in self.property_groups.items():
+            for prop in props:
+                self._property_group.setdefault(prop, group)
 
     def detect_conflicts(self, rule1: Dict[str, Any], rule2: Dict[str, Any]) -> List[str]:
         """
@@ -363,12 +358,11 @@ class PropertyConflictDetector(LoggerMixin):
         """Expand shorthand properties to their longhand equivalents."""
         expanded = properties.copy()
 
-        for prop, value in properties.items():
-            if prop in self.shorthand_expansions:
-                # Simple expansion - could be enhanced with proper value parsing
-                for longhand in self.shorthand_expansions[prop]:
-                    if longhand not in expanded:
-                        expanded[longhand] = value
+        for prop in self._shorthands.intersection(properties):
+            value = properties[prop]
+            # Simple expansion - could be enhanced with proper value parsing
+            for longhand in self.shorthand_expansions[prop]:
+                expanded.setdefault(longhand, value)
 
         return expanded
 
@@ -378,17 +372,16 @@ class PropertyConflictDetector(LoggerMixin):
         """Check for conflicts between shorthand and longhand properties."""
         conflicts = []
 
-        for shorthand, longhands in self.shorthand_expansions.items():
-            # Check if one has shorthand and other has longhand
-            if shorthand in props1:
-                for longhand in longhands:
-                    if longhand in props2:
-                        conflicts.append(longhand)
+        # Check if one has shorthand and other has longhand
+        for shorthand in self._shorthands.intersection(props1):
+            conflicts.extend(
+                longhand for longhand in self.shorthand_expansions[shorthand] if longhand in props2
+            )
 
-            if shorthand in props2:
-                for longhand in longhands:
-                    if longhand in props1:
-                        conflicts.append(longhand)
+        for shorthand in self._shorthands.intersection(props2):
+            conflicts.extend(
+                longhand for longhand in self.shorthand_expansions[shorthand] if longhand in props1
+            )
 
         return conflicts
 
@@ -397,66 +390,81 @@ class PropertyConflictDetector(LoggerMixin):
         categorized = defaultdict(list)
 
         for conflict in conflicts:
-            for group, props in self.property_groups.items():
-                if conflict in props:
-                    categorized[group].append(conflict)
-                    break
-            else:
-                categorized["other"].append(conflict)
+            categorized[self._property_group.get(conflict, "other")].append(conflict)
 
         return dict(categorized)
 
 
-class ConflictResolutionSuggester(LoggerMixin):
-    """Generates suggestions for resolving CSS conflicts."""
+@lru_cache(maxsize=512)
+def _resolution_template(
+    spec1: int,
+    spec2: int,
+    spacing_conflict: bool,
+    many_conflicts: bool,
+    both_ids: bool,
+) -> str:
+    """
+    Build the resolution suggestion for one conflict shape.
+
+    Conflicts with the same specificity scores and property flags share a template;
+    the selectors are filled in through the {selector1}/{selector2} placeholders.
+    """
+    suggestions = []
+
+    # Specificity-based suggestions
+    if spec1 == spec2:
+        suggestions.append(
+            "Selectors '{selector1}' and '{selector2}' have equal specificity. "
+            "Consider using more specific selectors or reordering rules."
+        )
+    elif abs(spec1 - spec2) >= 2:
+        higher, lower = (
+            ("{selector1}", "{selector2}") if spec1 > spec2 else ("{selector2}", "{selector1}")
+        )
+        suggestions.append(
+            f"Selector '{higher}' has higher specificity than '{lower}'. "
+            "Consider simplifying it to improve maintainability."
+        )
 
-    def suggest_resolution(self, conflict: StyleConflict) -> str:
-        """Generate a resolution suggestion for a style conflict."""
-        spec1 = sum(conflict.specificity1)
-        spec2 = sum(conflict.specificity2)
+    # Property-specific suggestions
+    if spacing_conflict:
+        suggestions.append(
+            "Both margin and padding are conflicting. Consider using a consistent spacing system."
+        )
 
-        suggestions = []
+    if many_conflicts:
+        suggestions.append(
+            "Multiple properties are conflicting. Consider creating a shared base class "
+            "or using CSS variables for consistent styling."
+        )
 
-        # Specificity-based suggestions
-        if spec1 == spec2:
-            suggestions.append(
-                f"Selectors '{conflict.selector1}' and '{conflict.selector2}' have equal specificity. "
-                "Consider using more specific selectors or reordering rules."
-            )
-        elif abs(spec1 - spec2) >= 2:
-            higher = conflict.selector1 if spec1 > spec2 else conflict.selector2
-            lower = conflict.selector2 if spec1 > spec2 else conflict.selector1
-            suggestions.append(
-                f"Selector '{higher}' has higher specificity than '{lower}'. "
-                "Consider simplifying it to improve maintainability."
-            )
+    # Selector type suggestions
+    if both_ids:
+        suggestions.append(
+            "Both selectors use IDs. IDs should be unique - consider using classes instead."
+        )
 
-        # Property-specific suggestions
-        if (
-            "margin" in conflict.conflicting_properties
-            and "padding" in conflict.conflicting_properties
-        ):
-            suggestions.append(
-                "Both margin and padding are conflicting. Consider using a consistent spacing system."
-            )
+    return (
+        " ".join(suggestions)
+        if suggestions
+        else "Consider using more specific selectors or reorganizing your CSS structure."
+    )
 
-        if len(conflict.conflicting_properties) > 3:
-            suggestions.append(
-                "Multiple properties are conflicting. Consider creating a shared base class "
-                "or using CSS variables for consistent styling."
-            )
 
-        # Selector type suggestions
-        if "#" in conflict.selector1 and "#" in conflict.selector2:
-            suggestions.append(
-                "Both selectors use IDs. IDs should be unique - consider using classes instead."
-            )
+class ConflictResolutionSuggester(LoggerMixin):
+    """Generates suggestions for resolving CSS conflicts."""
 
-        return (
-            " ".join(suggestions)
-            if suggestions
-            else "Consider using more specific selectors or reorganizing your CSS structure."
+    def suggest_resolution(self, conflict: StyleConflict) -> str:
+        """Generate a resolution suggestion for a style conflict."""
+        properties = conflict.conflicting_properties
+        template = _resolution_template(
+            sum(conflict.specificity1),
+            sum(conflict.specificity2),
+            "margin" in properties and "padding" in properties,
+            len(properties) > 3,
+            "#" in conflict.selector1 and "#" in conflict.selector2,
         )
+        return template.format(selector1=conflict.selector1, selector2=conflict.selector2)
 
     def suggest_selector_improvements(self, overlap: SelectorOverlap) -> List[str]:
         """Suggest improvements for overlapping selectors."""
@@ -492,6 +500,40 @@ class ConflictResolutionSuggester(LoggerMixin):
         return suggestions
 
 
+def _detect_group_conflicts(
+    detector: PropertyConflictDetector,
+    selectors: List[str],
+    specificity_scores: List[Tuple[int, int, int]],
+    selector_rules: Dict[str, List[Dict[str, Any]]],
+) -> List[OverlapConflict]:
+    """Detect property conflicts between every rule pair of one overlap group."""
+    found: List[OverlapConflict] = []
+
+    # Check each pair of overlapping selectors
+    for i, sel1 in enumerate(selectors):
+        for j in range(i + 1, len(selectors)):
+            sel2 = selectors[j]
+
+            # Check conflicts between all rule combinations
+            for r1 in selector_rules[sel1]:
+                for r2 in selector_rules[sel2]:
+                    conflicts = detector.detect_conflicts(r1, r2)
+                    if conflicts:
+                        found.append(
+                            (
+                                sel1,
+                                sel2,
+                                conflicts,
+                                specificity_scores[i],
+                                specificity_scores[j],
+                                r1.get("line", None),
+                                r2.get("line", None),
+                            )
+                        )
+
+    return found
+
+
 class ConflictDetector(LoggerMixin):
     """Main conflict detection system for CSS stylesheets."""
 
@@ -500,6 +542,23 @@ class ConflictDetector(LoggerMixin):
         self.property_detector = PropertyConflictDetector()
         self.resolution_suggester = ConflictResolutionSuggester()
 
+    def _find_overlap_conflicts(
+        self,
+        overlaps: List[SelectorOverlap],
+        selector_to_rules: Dict[str, List[Dict[str, Any]]],
+    ) -> List[OverlapConflict]:
+        """Detect property conflicts for all overlap groups."""
+        return [
+            found
+            for overlap in overlaps
+            for found in _detect_group_conflicts(
+                self.property_detector,
+                overlap.selectors,
+                overlap.specificity_scores,
+                selector_to_rules,
+            )
+        ]
+
     def analyze_conflicts(self, css_content: str) -> ConflictAnalysisResult:
         """
         Analyze CSS content for conflicts.
@@ -512,36 +571,13 @@ class ConflictDetector(LoggerMixin):
         """
         result = ConflictAnalysisResult()
 
+        # Blank input has no rules to compare; skip building the stylesheet entirely
+        if not css_content.strip():
+            return result
+
         try:
-            # Parse CSS
-            from textual.css.tokenize import tokenize_values
-            from textual.theme import BUILTIN_THEMES
-            from textual.design import ColorSystem
-
-            # Get default theme variables
-            default_theme = BUILTIN_THEMES.get("textual-dark")
-            if default_theme:
-                color_system = ColorSystem(
-                    primary=default_theme.primary,
-                    secondary=default_theme.secondary,
-                    warning=default_theme.warning,
-                    error=default_theme.error,
-                    success=default_theme.success,
-                    accent=default_theme.accent,
-                    foreground=default_theme.foreground,
-                    background=default_theme.background,
-                    surface=default_theme.surface,
-                    panel=default_theme.panel,
-                    boost=default_theme.boost,
-                    dark=default_theme.dark,
-                    luminosity_spread=default_theme.luminosity_spread,
-                    text_alpha=default_theme.text_alpha,
-                    variables=default_theme.variables,
-                )
-                theme_variables = color_system.generate()
-                variable_tokens = tokenize_values(theme_variables)
-            else:
-                variable_tokens = None
+            # Theme variables are tokenized once per process and shared with the validator
+            variable_tokens = get_variable_tokens("textual-dark")
 
             # Parse stylesheet - this will raise errors if CSS is invalid
             try:
@@ -553,9 +589,12 @@ class ConflictDetector(LoggerMixin):
                 self.logger.error(f"CSS parsing error: {e}")
                 raise
 
-            # Extract rules and build data structures
-            rules = []
+            # Walk the stylesheet once, keeping rule data only in the per-selector index
             selector_to_rules = defaultdict(list)
+            duplicate_counts: Dict[str, int] = defaultdict(int)
+            # (selector, earlier rule, repeated rule) for each block that repeats the
+            # block directly before it for the same selector
+            exact_duplicates: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = []
 
             for rule in stylesheet:
                 # Try to extract selectors and properties from the rule
@@ -564,6 +603,9 @@ class ConflictDetector(LoggerMixin):
                     selector_str = str(rule.selectors).strip()
                     if selector_str.startswith("* "):
                         selector_str = selector_str[2:]  # Remove "* " prefix
+                    # Selectors and property names repeat heavily across rules, so intern
+                    # them to make the dict/set lookups below pointer comparisons
+                    selector_str = sys.intern(selector_str)
 
                     rule_data: Dict[str, Any] = {
                         "selectors": [selector_str],
@@ -577,62 +619,77 @@ class ConflictDetector(LoggerMixin):
                         for name, value in rule.styles._rules.items():
                             # Skip auto_* properties
                             if not name.startswith("auto_"):
-                                rule_data["properties"][name] = str(value)
+                                rule_data["properties"][sys.intern(name)] = str(value)
 
                     # Only add rules that have properties
                     if rule_data["properties"]:
-                        rules.append(rule_data)
-
                         # Map selectors to rules
                         for selector in rule_data["selectors"]:
-                            selector_to_rules[selector].append(rule_data)
+                            rules_list = selector_to_rules[selector]
+                            previous = rules_list[-1] if rules_list else None
+                            if previous and previous["properties"] == rule_data["properties"]:
+                                # Repeats the previous block for this selector - report it
+                                # directly rather than feeding it through pairwise detection.
+                                # Only the previous block counts: if another block sits in
+                                # between, removing this one would change the result
+                                duplicate_counts[selector] += 1
+                                exact_duplicates.append((selector, previous, rule_data))
+                                continue
+
+                            rules_list.append(rule_data)
 
             # Analyze selector overlaps
             all_selectors = list(selector_to_rules.keys())
             overlaps = self.overlap_analyzer.find_overlapping_groups(all_selectors)
             result.overlapping_selectors = overlaps
 
+            # Report identical blocks, now that every selector's specificity is known
+            for selector, original, duplicate in exact_duplicates:
+                specificity = self.overlap_analyzer.selector_specificity[selector]
+                result.conflicts.append(
+                    StyleConflict(
+                        selector1=selector,
+                        selector2=selector,
+                        conflicting_properties=sorted(duplicate["properties"]),
+                        specificity1=specificity,
+                        specificity2=specificity,
+                        line1=original.get("line", None),
+                        line2=duplicate.get("line", None),
+                        resolution_suggestion=(
+                            f"Rule for '{selector}' exactly duplicates an earlier rule. "
+                            "Remove the redundant rule."
+                        ),
+                        exact_duplicate=True,
+                    )
+                )
+
             # Find property conflicts between overlapping selectors
-            for overlap in overlaps:
-                # Check each pair of overlapping selectors
-                for i, sel1 in enumerate(overlap.selectors):
-                    for sel2 in overlap.selectors[i + 1 :]:
-                        # Get rules for each selector
-                        rules1 = selector_to_rules[sel1]
-                        rules2 = selector_to_rules[sel2]
-
-                        # Check conflicts between all rule combinations
-                        for r1 in rules1:
-                            for r2 in rules2:
-                                conflicts = self.property_detector.detect_conflicts(r1, r2)
-                                if conflicts:
-                                    conflict = StyleConflict(
-                                        selector1=sel1,
-                                        selector2=sel2,
-                                        conflicting_properties=conflicts,
-                                        specificity1=overlap.specificity_scores[
-                                            overlap.selectors.index(sel1)
-                                        ],
-                                        specificity2=overlap.specificity_scores[
-                                            overlap.selectors.index(sel2)
-                                        ],
-                                        line1=r1.get("line", None),
-                                        line2=r2.get("line", None),
-                                    )
-                                    conflict.resolution_suggestion = (
-                                        self.resolution_suggester.suggest_resolution(conflict)
-                                    )
-                                    result.conflicts.append(conflict)
+            for found in self._find_overlap_conflicts(overlaps, selector_to_rules):
+                sel1, sel2, conflicts, spec1, spec2, line1, line2 = found
+                conflict = StyleConflict(
+                    selector1=sel1,
+                    selector2=sel2,
+                    conflicting_properties=conflicts,
+                    specificity1=spec1,
+                    specificity2=spec2,
+                    line1=line1,
+                    line2=line2,
+                )
+                conflict.resolution_suggestion = self.resolution_suggester.suggest_resolution(
+                    conflict
+                )
+                result.conflicts.append(conflict)
 
             # Also check for conflicts within the same selector (duplicate rules)
             for selector, rules_list in selector_to_rules.items():
-                if len(rules_list) > 1:
+                rule_count = len(rules_list) + duplicate_counts[selector]
+                if rule_count > 1:
                     # Multiple rules with same selector - check for conflicts
                     for i, r1 in enumerate(rules_list):
                         for r2 in rules_list[i + 1 :]:
                             conflicts = self.property_detector.detect_conflicts(r1, r2)
                             if conflicts:
-                                specificity = self.overlap_analyzer._calculate_specificity(selector)
+                                specificity = self.overlap_analyzer.selector_specificity[selector]
                                 conflict = StyleConflict(
                                     selector1=selector,
                                     selector2=selector,
@@ -651,19 +708,20 @@ class ConflictDetector(LoggerMixin):
                     if not any(selector in overlap.selectors for overlap in overlaps):
                         result.overlapping_selectors.append(
                             SelectorOverlap(
-                                selectors=[selector] * len(rules_list),
+                                selectors=[selector] * rule_count,
                                 overlap_type="exact",
                                 specificity_scores=[
-                                    self.overlap_analyzer._calculate_specificity(selector)
+                                    self.overlap_analyzer.selector_specificity[selector]
                                 ]
-                                * len(rules_list),
+                                * rule_count,
                             )
                         )
 
-            # Categorize property conflicts
+            # Categorize property conflicts; identical blocks have no differing values
             all_conflicts = []
             for conflict in result.conflicts:
-                all_conflicts.extend(conflict.conflicting_properties)
+                if not conflict.exact_duplicate:
+                    all_conflicts.extend(conflict.conflicting_properties)
             if all_conflicts:
                 result.property_conflicts = self.property_detector.categorize_conflicts(
                     all_conflicts
@@ -674,44 +732,27 @@ class ConflictDetector(LoggerMixin):
                 suggestions = self.resolution_suggester.suggest_selector_improvements(overlap)
                 result.resolution_suggestions.extend(suggestions)
 
-            # Check for specificity issues
+            # Check for specificity issues, reusing the scores from overlap grouping
+            selector_specificity = self.overlap_analyzer.selector_specificity
             for selector in all_selectors:
-                specificity = self.overlap_analyzer._calculate_specificity(selector)
+                specificity = selector_specificity[selector]
                 spec_sum = sum(specificity)
+                issue = None
                 if spec_sum > 10:
-                    result.specificity_issues.append(
-                        {
-                            "selector": selector,
-                            "specificity": specificity,
-                            "score": spec_sum,
-                            "issue": "High specificity - consider simplifying",
-                        }
-                    )
+                    issue = "High specificity - consider simplifying"
                 elif specificity[0] > 1:
-                    result.specificity_issues.append(
-                        {
-                            "selector": selector,
-                            "specificity": specificity,
-                            "score": spec_sum,
-                            "issue": "Multiple IDs in selector - avoid if possible",
-                        }
-                    )
+                    issue = "Multiple IDs in selector - avoid if possible"
                 elif specificity[0] >= 1 and spec_sum >= 3:
-                    result.specificity_issues.append(
-                        {
-                            "selector": selector,
-                            "specificity": specificity,
-                            "score": spec_sum,
-                            "issue": "ID with additional selectors - consider simplifying",
-                        }
-                    )
+                    issue = "ID with additional selectors - consider simplifying"
                 elif spec_sum >= 5:
+                    issue = "Moderately high specificity - review if needed"
+                if issue:
                     result.specificity_issues.append(
                         {
                             "selector": selector,
                             "specificity": specificity,
                             "score": spec_sum,
-                            "issue": "Moderately high specificity - review if needed",
+                            "issue": issue,
                         }
                     )
 
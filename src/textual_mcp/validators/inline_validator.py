@@ -1,6 +1,7 @@
 """Inline CSS validator using Textual's parse_declarations."""
 
-from typing import List, Any
+from collections import Counter
+from typing import List, Any, Optional
 from dataclasses import dataclass
 
 try:
@@ -13,7 +14,11 @@ from ..utils.errors import ValidationError
 from ..utils.logging_config import LoggerMixin
 
 
-@dataclass
+# Shared validator instance, created on first use
+_inline_validator: Optional["InlineValidator"] = None
+
+
+@dataclass(slots=True)
 class InlineValidationResult:
     """Result of inline CSS validation."""
 
@@ -65,22 +70,28 @@ class InlineValidator(LoggerMixin):
         """Perform additional validation on parsed declarations."""
         try:
             # Check for duplicate properties
-            seen_properties = set()
-            for declaration in declarations:
-                prop_name = (
-                    str(declaration.name) if hasattr(declaration, "name") else str(declaration)
-                )
-                if prop_name in seen_properties:
-                    warnings.append(
-                        ValidationError(f"Duplicate property: {prop_name}", property_name=prop_name)
-                    )
-                seen_properties.add(prop_name)
-
-            # Check for missing semicolons (basic check)
-            if original_string.strip() and not original_string.strip().endswith(";"):
-                # Only warn if there are multiple declarations
-                if ";" in original_string:
-                    warnings.append(ValidationError("Missing semicolon at end of declarations"))
+            name_counts = Counter(
+                str(getattr(declaration, "name", declaration)) for declaration in declarations
+            )
+            warnings.extend(
+                ValidationError(f"Duplicate property: {prop_name}", property_name=prop_name)
+                for prop_name, count in name_counts.items()
+                if count > 1
+            )
+
+            # Check for missing semicolons (basic check). Only warn if there are multiple
+            # declarations, i.e. some semicolon exists but text follows the last one
+            _, semicolon, tail = original_string.rpartition(";")
+            if semicolon and tail and not tail.isspace():
+                warnings.append(ValidationError("Missing semicolon at end of declarations"))
 
         except Exception as e:
             self.logger.warning(f"Additional inline validation failed: {e}")
+
+
+def get_inline_validator() -> InlineValidator:
+    """Get or create the shared inline validator instance."""
+    global _inline_validator
+    if _inline_validator is None:
+        _inline_validator = InlineValidator()
+    return _inline_validator
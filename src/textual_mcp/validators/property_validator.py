@@ -1,13 +1,85 @@
 """CSS property and value validator for Textual stylesheets."""
 
 import re
-from typing import List, Optional
-from dataclasses import dataclass
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 from ..utils.logging_config import LoggerMixin
-
-
-@dataclass
+from ..utils.parallel import discard_process_pool, get_process_pool, usable_cpu_count
+
+# Patterns are compiled once here rather than looked up in re's cache on every call
+HEX_COLOR_PATTERN = re.compile(r"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$")
+RGB_COLOR_PATTERN = re.compile(r"^rgba?\([^)]+\)$")
+HSL_COLOR_PATTERN = re.compile(r"^hsla?\([^)]+\)$")
+COLOR_PATTERNS_BY_PREFIX = {
+    "#": HEX_COLOR_PATTERN,
+    "r": RGB_COLOR_PATTERN,
+    "h": HSL_COLOR_PATTERN,
+}
+
+# Basic set of named colors, matched case-insensitively
+NAMED_COLORS = frozenset(
+    {
+        "black",
+        "white",
+        "red",
+        "green",
+        "blue",
+        "yellow",
+        "cyan",
+        "magenta",
+        "gray",
+        "grey",
+        "orange",
+        "purple",
+        "brown",
+        "pink",
+        "lime",
+        "olive",
+        "navy",
+        "teal",
+        "silver",
+        "maroon",
+        "aqua",
+        "fuchsia",
+    }
+)
+
+# ANSI color names used by Textual
+_ANSI_NAMES = ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white")
+ANSI_COLORS = frozenset(
+    [f"ansi_{name}{dim}" for name in ("default", *_ANSI_NAMES) for dim in ("", "_dim")]
+    + [f"ansi_bright_{name}" for name in _ANSI_NAMES]
+)
+
+# Every literal color value accepted verbatim
+COLOR_LITERALS = NAMED_COLORS | ANSI_COLORS | {"transparent", "auto"}
+
+# Dimension values accepted verbatim, and the units a numeric dimension may end with
+DIMENSION_KEYWORDS = frozenset({"auto", "1fr", "100%", "100vh", "100vw"})
+DIMENSION_UNITS = ("%", "fr", "vh", "vw", "vmin", "vmax")
+
+# A complete /* ... */ comment, which may span several lines
+BLOCK_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# One "property: value;" declaration per line. Whitespace never crosses a newline,
+# anything from an unterminated "/*" comment opener to the end of the line is ignored,
+# and lines with a brace are rule headers or closers, never declarations
+DECLARATION_PATTERN = re.compile(
+    r"^[^\S\n]*([a-z-]+)[^\S\n]*:[^\S\n]*((?:(?!/\*)[^\n{}])+?)[^\S\n]*;?[^\S\n]*(?:/\*[^\n{}]*)?$",
+    re.MULTILINE,
+)
+
+
+# Shared validator instance, created on first use
+_property_validator: Optional["TextualPropertyValidator"] = None
+
+
+@dataclass(slots=True)
 class PropertyValidationError:
     """Represents a property validation error."""
 
@@ -21,107 +93,113 @@ class PropertyValidationError:
 class TextualPropertyValidator(LoggerMixin):
     """Validates CSS properties and values according to Textual's rules."""
 
-    def __init__(self):
-        # Define valid Textual CSS properties
-        # Based on Textual's documentation and source code
-        self.valid_properties = {
-            # Layout properties
-            "display",
-            "layout",
-            "dock",
-            "layer",
-            "layers",
-            "align",
-            "align-horizontal",
-            "align-vertical",
-            "content-align",
-            "content-align-horizontal",
-            "content-align-vertical",
-            # Size properties
-            "width",
-            "height",
-            "min-width",
-            "min-height",
-            "max-width",
-            "max-height",
-            # Spacing properties
-            "margin",
-            "margin-top",
-            "margin-right",
-            "margin-bottom",
-            "margin-left",
-            "padding",
-            "padding-top",
-            "padding-right",
-            "padding-bottom",
-            "padding-left",
-            # Position properties
-            "offset",
-            "offset-x",
-            "offset-y",
-            # Border properties
-            "border",
-            "border-top",
-            "border-right",
-            "border-bottom",
-            "border-left",
-            "border-title-align",
-            "border-subtitle-align",
-            # Text properties
-            "text-align",
-            "text-style",
-            "text-opacity",
-            # Color properties
-            "color",
-            "background",
-            "tint",
-            "link-color",
-            "link-background",
-            "link-style",
-            "link-hover-color",
-            "link-hover-background",
-            "link-hover-style",
-            # Scrollbar properties
-            "scrollbar-color",
-            "scrollbar-color-hover",
-            "scrollbar-color-active",
-            "scrollbar-background",
-            "scrollbar-background-hover",
-            "scrollbar-background-active",
-            "scrollbar-size",
-            "scrollbar-size-horizontal",
-            "scrollbar-size-vertical",
-            "scrollbar-corner-color",
-            # Grid properties
-            "grid-size",
-            "grid-columns",
-            "grid-rows",
-            "grid-gutter",
-            "row-span",
-            "column-span",
-            # Overflow properties
-            "overflow",
-            "overflow-x",
-            "overflow-y",
-            # Visibility
-            "visibility",
-            "opacity",
-            # Box model
-            "box-sizing",
-            # Outline
-            "outline",
-            "outline-top",
-            "outline-right",
-            "outline-bottom",
-            "outline-left",
-            # Keyline
-            "keyline",
-            # Hatch
-            "hatch",
-        }
+    # Define valid Textual CSS properties
+    # Based on Textual's documentation and source code.
+    # Names are interned so lookups of interned parsed names compare by identity
+    VALID_PROPERTIES = frozenset(
+        map(
+            sys.intern,
+            {
+                # Layout properties
+                "display",
+                "layout",
+                "dock",
+                "layer",
+                "layers",
+                "align",
+                "align-horizontal",
+                "align-vertical",
+                "content-align",
+                "content-align-horizontal",
+                "content-align-vertical",
+                # Size properties
+                "width",
+                "height",
+                "min-width",
+                "min-height",
+                "max-width",
+                "max-height",
+                # Spacing properties
+                "margin",
+                "margin-top",
+                "margin-right",
+                "margin-bottom",
+                "margin-left",
+                "padding",
+                "padding-top",
+                "padding-right",
+                "padding-bottom",
+                "padding-left",
+                # Position properties
+                "offset",
+                "offset-x",
+                "offset-y",
+                # Border properties
+                "border",
+                "border-top",
+                "border-right",
+                "border-bottom",
+                "border-left",
+                "border-title-align",
+                "border-subtitle-align",
+                # Text properties
+                "text-align",
+                "text-style",
+                "text-opacity",
+                # Color properties
+                "color",
+                "background",
+                "tint",
+                "link-color",
+                "link-background",
+                "link-style",
+                "link-hover-color",
+                "link-hover-background",
+                "link-hover-style",
+                # Scrollbar properties
+                "scrollbar-color",
+                "scrollbar-color-hover",
+                "scrollbar-color-active",
+                "scrollbar-background",
+                "scrollbar-background-hover",
+                "scrollbar-background-active",
+                "scrollbar-size",
+                "scrollbar-size-horizontal",
+                "scrollbar-size-vertical",
+                "scrollbar-corner-color",
+                # Grid properties
+                "grid-size",
+                "grid-columns",
+                "grid-rows",
+                "grid-gutter",
+                "row-span",
+                "column-span",
+                # Overflow properties
+                "overflow",
+                "overflow-x",
+                "overflow-y",
+                # Visibility
+                "visibility",
+                "opacity",
+                # Box model
+                "box-sizing",
+                # Outline
+                "outline",
+                "outline-top",
+                "outline-right",
+                "outline-bottom",
+                "outline-left",
+                # Keyline
+                "keyline",
+                # Hatch
+                "hatch",
+            },
+        )
+    )
 
-        # Properties that require integer values (no units or percentages)
-        self.integer_only_properties = {
+    # Properties that require integer values (no units or percentages)
+    INTEGER_ONLY_PROPERTIES = frozenset(
+        {
             "margin",
             "margin-top",
             "margin-right",
@@ -141,9 +219,11 @@ class TextualPropertyValidator(LoggerMixin):
             "scrollbar-size-horizontal",
             "scrollbar-size-vertical",
         }
+    )
 
-        # Properties that accept percentages
-        self.percentage_properties = {
+    # Properties that accept percentages
+    PERCENTAGE_PROPERTIES = frozenset(
+        {
             "width",
             "height",
             "min-width",
@@ -153,9 +233,11 @@ class TextualPropertyValidator(LoggerMixin):
             "opacity",
             "text-opacity",
         }
+    )
 
-        # Properties that accept fr units (fractional units for grid)
-        self.fr_properties = {
+    # Properties that accept fr units (fractional units for grid)
+    FR_PROPERTIES = frozenset(
+        {
             "width",
             "height",
             "min-width",
@@ -165,42 +247,97 @@ class TextualPropertyValidator(LoggerMixin):
             "grid-columns",
             "grid-rows",
         }
+    )
+
+    # Properties that accept specific keywords
+    KEYWORD_PROPERTIES: Mapping[str, FrozenSet[str]] = MappingProxyType(
+        {
+            "display": frozenset({"block", "none"}),
+            "visibility": frozenset({"visible", "hidden"}),
+            "overflow": frozenset({"scroll", "hidden", "auto"}),
+            "overflow-x": frozenset({"scroll", "hidden", "auto"}),
+            "overflow-y": frozenset({"scroll", "hidden", "auto"}),
+            "dock": frozenset({"top", "right", "bottom", "left"}),
+            "align": frozenset({"left", "center", "right"}),
+            "align-horizontal": frozenset({"left", "center", "right"}),
+            "align-vertical": frozenset({"top", "middle", "bottom"}),
+            "content-align": frozenset({"left", "center", "right", "top", "middle", "bottom"}),
+            "content-align-horizontal": frozenset({"left", "center", "right"}),
+            "content-align-vertical": frozenset({"top", "middle", "bottom"}),
+            "text-align": frozenset({"left", "center", "right", "justify"}),
+            "text-style": frozenset({"bold", "italic", "reverse", "strike", "underline", "none"}),
+            "border": frozenset(
+                {
+                    "solid",
+                    "double",
+                    "round",
+                    "ascii",
+                    "none",
+                    "hidden",
+                    "blank",
+                    "heavy",
+                    "thick",
+                    "panel",
+                    "tall",
+                    "wide",
+                }
+            ),
+            "border-title-align": frozenset({"left", "center", "right"}),
+            "border-subtitle-align": frozenset({"left", "center", "right"}),
+            "box-sizing": frozenset({"border-box", "content-box"}),
+            "layout": frozenset({"horizontal", "vertical", "grid"}),
+        }
+    )
 
-        # Properties that accept specific keywords
-        self.keyword_properties = {
-            "display": {"block", "none"},
-            "visibility": {"visible", "hidden"},
-            "overflow": {"scroll", "hidden", "auto"},
-            "overflow-x": {"scroll", "hidden", "auto"},
-            "overflow-y": {"scroll", "hidden", "auto"},
-            "dock": {"top", "right", "bottom", "left"},
-            "align": {"left", "center", "right"},
-            "align-horizontal": {"left", "center", "right"},
-            "align-vertical": {"top", "middle", "bottom"},
-            "content-align": {"left", "center", "right", "top", "middle", "bottom"},
-            "content-align-horizontal": {"left", "center", "right"},
-            "content-align-vertical": {"top", "middle", "bottom"},
-            "text-align": {"left", "center", "right", "justify"},
-            "text-style": {"bold", "italic", "reverse", "strike", "underline", "none"},
-            "border": {
-                "solid",
-                "double",
-                "round",
-                "ascii",
-                "none",
-                "hidden",
-                "blank",
-                "heavy",
-                "thick",
-                "panel",
-                "tall",
-                "wide",
-            },
-            "border-title-align": {"left", "center", "right"},
-            "border-subtitle-align": {"left", "center", "right"},
-            "box-sizing": {"border-box", "content-box"},
-            "layout": {"horizontal", "vertical", "grid"},
+    # Properties with shorthand spacing rules
+    SPACING_PROPERTIES = frozenset({"margin", "padding"})
+
+    # Properties that take a dimension value
+    DIMENSION_PROPERTIES = frozenset(
+        {
+            "width",
+            "height",
+            "min-width",
+            "min-height",
+            "max-width",
+            "max-height",
         }
+    )
+
+    # Properties that take a color value
+    COLOR_PROPERTIES = frozenset(
+        {name for name in VALID_PROPERTIES if "color" in name} | {"background", "tint"}
+    )
+
+    def __init__(self, parallel_threshold: int = 50000) -> None:
+        """
+        Initialize the property validator.
+
+        Args:
+            parallel_threshold: Number of lines above which validate_css_content
+                spreads the work across a process pool
+        """
+        self.parallel_threshold = parallel_threshold
+        # Value checks don't depend on the line, so results are cached per
+        # (property_name, value) and the line is attached on the way out
+        self._check_value_cached = lru_cache(maxsize=4096)(self._check_value)
+        self._value_checks = self._build_value_checks()
+
+    def _build_value_checks(
+        self,
+    ) -> Dict[str, Tuple[Callable[[str, str], Optional[PropertyValidationError]], ...]]:
+        """Map each property name to the value checks that apply to it, in order."""
+        checks: Dict[str, List[Callable[[str, str], Optional[PropertyValidationError]]]] = {}
+        for names, check in (
+            (self.KEYWORD_PROPERTIES, self._validate_keyword_value),
+            (self.INTEGER_ONLY_PROPERTIES, self._validate_integer_value),
+            (self.SPACING_PROPERTIES, self._validate_spacing_value),
+            (self.DIMENSION_PROPERTIES, self._validate_dimension_value),
+            (self.COLOR_PROPERTIES, self._validate_color_value),
+        ):
+            for name in names:
+                checks.setdefault(sys.intern(name), []).append(check)
+        return {name: tuple(chain) for name, chain in checks.items()}
 
     def validate_property(
         self, property_name: str, value: str, line: Optional[int] = None
@@ -217,7 +354,7 @@ class TextualPropertyValidator(LoggerMixin):
             PropertyValidationError if validation fails, None if valid
         """
         # Check if property is valid for Textual
-        if property_name not in self.valid_properties:
+        if property_name not in self.VALID_PROPERTIES:
             # Special case: 'gap' is not a valid Textual property
             # (it might be confused with 'grid-gutter' or spacing properties)
             if property_name == "gap":
@@ -241,67 +378,47 @@ class TextualPropertyValidator(LoggerMixin):
         self, property_name: str, value: str, line: Optional[int] = None
     ) -> Optional[PropertyValidationError]:
         """Validate the value for a specific property."""
-        value = value.strip()
+        error = self._check_value_cached(property_name, value)
+        if error is None:
+            return None
+        # Never hand out the cached instance itself
+        return replace(error, line=line)
 
-        # Check keyword properties
-        if property_name in self.keyword_properties:
-            valid_keywords = self.keyword_properties[property_name]
-            # Some properties accept multiple keywords
-            if property_name == "text-style":
-                # text-style can have multiple values
-                styles = value.split()
-                for style in styles:
-                    if style not in valid_keywords:
-                        return PropertyValidationError(
-                            property_name=property_name,
-                            value=value,
-                            message=f"Invalid value '{style}' for {property_name}. Valid values: {', '.join(valid_keywords)}",
-                            line=line,
-                        )
-            elif value not in valid_keywords and not self._is_css_variable(value):
-                # Single keyword check
-                if not any(self._matches_pattern(value, kw) for kw in valid_keywords):
-                    return PropertyValidationError(
-                        property_name=property_name,
-                        value=value,
-                        message=f"Invalid value for {property_name}. Valid values: {', '.join(valid_keywords)}",
-                        line=line,
-                    )
-
-        # Check integer-only properties
-        if property_name in self.integer_only_properties:
-            error = self._validate_integer_value(property_name, value)
-            if error:
-                error.line = line
-                return error
+    def _check_value(self, property_name: str, value: str) -> Optional[PropertyValidationError]:
+        """Check a property value, independent of where it appears."""
+        value = value.strip()
 
-        # Check margin/padding special rules
-        if property_name in ["margin", "padding"]:
-            error = self._validate_spacing_value(property_name, value)
+        for check in self._value_checks.get(property_name, ()):
+            error = check(property_name, value)
             if error:
-                error.line = line
                 return error
 
-        # Check width/height values
-        if property_name in [
-            "width",
-            "height",
-            "min-width",
-            "min-height",
-            "max-width",
-            "max-height",
-        ]:
-            error = self._validate_dimension_value(property_name, value)
-            if error:
-                error.line = line
-                return error
+        return None
 
-        # Check color values
-        if "color" in property_name or property_name in ["background", "tint"]:
-            error = self._validate_color_value(property_name, value)
-            if error:
-                error.line = line
-                return error
+    def _validate_keyword_value(
+        self, property_name: str, value: str
+    ) -> Optional[PropertyValidationError]:
+        """Validate that a value is one of the property's keywords."""
+        valid_keywords = self.KEYWORD_PROPERTIES[property_name]
+
+        # Some properties accept multiple keywords
+        if property_name == "text-style":
+            # text-style can have multiple values
+            styles = value.split()
+            if not valid_keywords.issuperset(styles):
+                style = next(style for style in styles if style not in valid_keywords)
+                return PropertyValidationError(
+                    property_name=property_name,
+                    value=value,
+                    message=f"Invalid value '{style}' for {property_name}. Valid values: {', '.join(valid_keywords)}",
+                )
+        elif value not in valid_keywords and not self._is_css_variable(value):
+            # Single keyword check
+            return PropertyValidationError(
+                property_name=property_name,
+                value=value,
+                message=f"Invalid value for {property_name}. Valid values: {', '.join(valid_keywords)}",
+            )
 
         return None
 
@@ -371,29 +488,14 @@ class TextualPropertyValidator(LoggerMixin):
             return None
 
         # Check for valid keywords
-        if value in ["auto", "1fr", "100%", "100vh", "100vw"]:
+        if value in DIMENSION_KEYWORDS:
             return None
 
-        # Check for percentage
-        if value.endswith("%"):
-            try:
-                float(value[:-1])
-                return None
-            except ValueError:
-                pass
-
-        # Check for fr units
-        if value.endswith("fr"):
-            try:
-                float(value[:-2])
-                return None
-            except ValueError:
-                pass
-
-        # Check for viewport units
-        if value.endswith(("vh", "vw", "vmin", "vmax")):
+        # Check for a number followed by a unit
+        if value.endswith(DIMENSION_UNITS):
+            unit = next(unit for unit in DIMENSION_UNITS if value.endswith(unit))
             try:
-                float(value[:-2])
+                float(value[: -len(unit)])
                 return None
             except ValueError:
                 pass
@@ -415,57 +517,17 @@ class TextualPropertyValidator(LoggerMixin):
         if self._is_css_variable(value):
             return None
 
-        # Check for transparent
-        if value in ["transparent", "auto"]:
+        # Keywords, named colors and ANSI names in their usual spelling are a single set lookup
+        if value in COLOR_LITERALS:
             return None
 
-        # Check for hex color
-        if re.match(r"^#[0-9a-fA-F]{3}$|^#[0-9a-fA-F]{6}$|^#[0-9a-fA-F]{8}$", value):
+        # Functional and hex colors, dispatched on their first character
+        pattern = COLOR_PATTERNS_BY_PREFIX.get(value[:1])
+        if pattern is not None and pattern.match(value):
             return None
 
-        # Check for rgb/rgba
-        if re.match(r"^rgba?\([^)]+\)$", value):
-            return None
-
-        # Check for hsl/hsla
-        if re.match(r"^hsla?\([^)]+\)$", value):
-            return None
-
-        # Check for color names (basic set)
-        color_names = {
-            "black",
-            "white",
-            "red",
-            "green",
-            "blue",
-            "yellow",
-            "cyan",
-            "magenta",
-            "gray",
-            "grey",
-            "orange",
-            "purple",
-            "brown",
-            "pink",
-            "lime",
-            "olive",
-            "navy",
-            "teal",
-            "silver",
-            "maroon",
-            "aqua",
-            "fuchsia",
-        }
-        if value.lower() in color_names:
-            return None
-
-        # Check for ANSI color names used by Textual
-        if re.match(
-            r"^ansi_(default|black|red|green|yellow|blue|magenta|cyan|white)(_dim)?$", value
-        ):
-            return None
-
-        if re.match(r"^ansi_bright_(black|red|green|yellow|blue|magenta|cyan|white)$", value):
+        # Named colors are case-insensitive; only values that matched nothing above pay for lower()
+        if value.lower() in NAMED_COLORS:
             return None
 
         # If none of the above, it's invalid
@@ -481,15 +543,9 @@ class TextualPropertyValidator(LoggerMixin):
 
     def _is_valid_integer(self, value: str) -> bool:
         """Check if value is a valid integer."""
-        try:
-            int(value)
-            return True
-        except ValueError:
-            return False
-
-    def _matches_pattern(self, value: str, pattern: str) -> bool:
-        """Check if value matches a pattern (for keyword matching)."""
-        return value == pattern
+        # Plain ASCII digits with an optional sign, checked without raising
+        digits = value[1:] if value[:1] in ("+", "-") else value
+        return digits.isascii() and digits.isdigit()
 
     def validate_css_content(self, css_content: str) -> List[PropertyValidationError]:
         """
@@ -501,31 +557,89 @@ class TextualPropertyValidator(LoggerMixin):
         Returns:
             List of validation errors
         """
+        # Blank out block comments up front, keeping their newlines so line numbers
+        # still line up and declarations inside multi-line comments are skipped
+        css_content = BLOCK_COMMENT_PATTERN.sub(
+            lambda match: "\n" * match.group().count("\n"), css_content
+        )
+
+        lines = css_content.count("\n") + 1
+        pool = get_process_pool() if lines > self.parallel_threshold else None
+        if pool is not None:
+            # Declarations never span lines, so the content splits cleanly on line
+            # boundaries and each chunk's line numbers are shifted back into place
+            chunks = self._split_on_lines(css_content, 4 * usable_cpu_count())
+            try:
+                chunk_errors = list(pool.map(_validate_css_chunk, *zip(*chunks)))
+                return [error for chunk in chunk_errors for error in chunk]
+            except (OSError, BrokenProcessPool) as e:
+                discard_process_pool()
+                self.logger.warning(
+                    f"Parallel property validation unavailable, running serially: {e}"
+                )
+
+        return self._validate_css_lines(css_content)
+
+    @staticmethod
+    def _split_on_lines(css_content: str, count: int) -> List[Tuple[str, int]]:
+        """
+        Split content into roughly equal chunks that end on line boundaries.
+
+        Boundaries are found with str.find and line offsets with str.count, so the
+        content is never materialized as a list of lines.
+
+        Returns:
+            List of (chunk, number of lines before the chunk) pairs
+        """
+        step = max(1, -(-len(css_content) // count))
+        chunks = []
+        start = 0
+        line_offset = 0
+        while True:
+            end = css_content.find("\n", start + step)
+            end = len(css_content) if end == -1 else end + 1
+            chunks.append((css_content[start:end], line_offset))
+            if end >= len(css_content):
+                return chunks
+            line_offset += css_content.count("\n", start, end)
+            start = end
+
+    def _validate_css_lines(
+        self, css_content: str, line_offset: int = 0
+    ) -> List[PropertyValidationError]:
+        """Validate declarations in CSS content whose first line follows line_offset."""
         errors = []
 
         # Simple regex-based extraction of properties
         # This is a simplified approach - in production, you'd use the parsed AST
-        lines = css_content.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            # Skip comments and empty lines
-            line = line.strip()
-            if not line or line.startswith("/*") or line.startswith("//"):
-                continue
+        # All declarations are found in one scan; line numbers are tracked by counting
+        # the newlines between consecutive matches
+        line_num = line_offset + 1
+        last_pos = 0
 
-            # Look for property declarations
-            # First remove comments from the line
-            if "/*" in line:
-                line = line[: line.index("/*")]
+        for match in DECLARATION_PATTERN.finditer(css_content):
+            line_num += css_content.count("\n", last_pos, match.start())
+            last_pos = match.start()
 
-            match = re.match(r"^\s*([a-z-]+)\s*:\s*(.+?)\s*;?\s*$", line)
-            if match:
-                property_name = match.group(1)
-                # Remove trailing semicolon and any whitespace
-                value = match.group(2).rstrip(";").strip()
+            property_name = sys.intern(match.group(1))
+            # Remove trailing semicolon and any whitespace
+            value = match.group(2).rstrip(";").strip()
 
-                error = self.validate_property(property_name, value, line_num)
-                if error:
-                    errors.append(error)
+            error = self.validate_property(property_name, value, line_num)
+            if error:
+                errors.append(error)
 
         return errors
+
+
+def get_property_validator() -> TextualPropertyValidator:
+    """Get or create the shared property validator instance."""
+    global _property_validator
+    if _property_validator is None:
+        _property_validator = TextualPropertyValidator()
+    return _property_validator
+
+
+def _validate_css_chunk(css_content: str, line_offset: int) -> List[PropertyValidationError]:
+    """Validate one chunk of CSS lines in a worker process."""
+    return get_property_validator()._validate_css_lines(css_content, line_offset)
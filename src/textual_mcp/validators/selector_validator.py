@@ -1,18 +1,36 @@
 """CSS selector validator using Textual's parse_selectors."""
 
+import re
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     from textual.css.parse import parse_selectors
     from textual.css.errors import StylesheetError
+    from textual.css.constants import VALID_PSEUDO_CLASSES
 except ImportError as e:
     raise ImportError(f"Failed to import Textual CSS components: {e}")
 
 from ..utils.logging_config import LoggerMixin
+from ..utils.parallel import discard_process_pool, get_process_pool, usable_cpu_count
 
+# A bare widget name, the only kind of type selector checked before parsing
+TYPE_NAME_PATTERN = re.compile(r"[A-Za-z_-][A-Za-z0-9_-]*")
 
-@dataclass
+# Selector punctuation blanked out before counting type names
+SELECTOR_PUNCTUATION_TABLE = str.maketrans(dict.fromkeys("#.[]:>+~()", " "))
+
+# Pseudo-class/element names that are not type names
+PSEUDO_NAMES = frozenset(VALID_PSEUDO_CLASSES) | {"active", "visited", "before", "after"}
+
+
+# Shared validator instance, created on first use
+_selector_validator: Optional["SelectorValidator"] = None
+
+
+@dataclass(frozen=True, slots=True)
 class SelectorValidationResult:
     """Result of selector validation."""
 
@@ -25,6 +43,21 @@ class SelectorValidationResult:
 class SelectorValidator(LoggerMixin):
     """Validator for CSS selectors."""
 
+    def __init__(self, parallel_threshold: int = 4096) -> None:
+        """
+        Initialize the selector validator.
+
+        Args:
+            parallel_threshold: Number of selectors above which validate_selectors
+                spreads the work across a process pool
+        """
+        self.parallel_threshold = parallel_threshold
+        # Results computed by the process pool, waiting to be moved into the cache
+        self._pool_results: Dict[str, SelectorValidationResult] = {}
+        # Stylesheets repeat the same selectors, and results are immutable so
+        # they can be shared between calls
+        self._validate_selector_cached = lru_cache(maxsize=2048)(self._lookup_selector)
+
     def validate_selector(self, selector: str) -> SelectorValidationResult:
         """
         Validate a single CSS selector.
@@ -35,9 +68,18 @@ class SelectorValidator(LoggerMixin):
         Returns:
             SelectorValidationResult with validation results
         """
+        return self._validate_selector_cached(selector)
+
+    def _lookup_selector(self, selector: str) -> SelectorValidationResult:
+        """Take a cache miss from the pool's results, or validate it here."""
+        result = self._pool_results.pop(selector, None)
+        return result if result is not None else self._validate_selector(selector)
+
+    def _validate_selector(self, selector: str) -> SelectorValidationResult:
+        """Validate a selector without consulting the cache."""
         try:
             # Check for unsupported combinators first
-            if ">" in selector or "+" in selector or "~" in selector:
+            if self._has_combinator(selector):
                 return SelectorValidationResult(
                     valid=False,
                     error="Textual does not support child (>), adjacent sibling (+), or general sibling (~) combinators",
@@ -45,6 +87,23 @@ class SelectorValidator(LoggerMixin):
                     specificity=(0, 0, 0),
                 )
 
+            selector_type = self._determine_selector_type(selector, has_combinator=False)
+
+            # For type selectors, validate case (Textual expects PascalCase for widgets)
+            case_error = None
+            if selector_type == "type":
+                # Check if it's a lowercase widget name
+                if selector.islower() or selector.isupper():
+                    case_error = SelectorValidationResult(
+                        valid=False,
+                        error="Textual widget selectors must use PascalCase (e.g., 'Button' not 'button')",
+                        selector_type=selector_type,
+                        specificity=(0, 0, 0),
+                    )
+                    # A bare name is rejected before it reaches Textual's parser
+                    if TYPE_NAME_PATTERN.fullmatch(selector):
+                        return case_error
+
             # Parse selector using Textual's parser
             selectors = parse_selectors(selector)
 
@@ -56,20 +115,8 @@ class SelectorValidator(LoggerMixin):
                     specificity=(0, 0, 0),
                 )
 
-            # Use the first selector for analysis
-            selectors[0]
-            selector_type = self._determine_selector_type(selector)
-
-            # For type selectors, validate case (Textual expects PascalCase for widgets)
-            if selector_type == "type":
-                # Check if it's a lowercase widget name
-                if selector.islower() or selector.isupper():
-                    return SelectorValidationResult(
-                        valid=False,
-                        error="Textual widget selectors must use PascalCase (e.g., 'Button' not 'button')",
-                        selector_type=selector_type,
-                        specificity=(0, 0, 0),
-                    )
+            if case_error is not None:
+                return case_error
 
             specificity = self._calculate_specificity(selector)
 
@@ -97,14 +144,44 @@ class SelectorValidator(LoggerMixin):
 
     def validate_selectors(self, selectors: List[str]) -> List[SelectorValidationResult]:
         """Validate multiple selectors."""
-        return [self.validate_selector(selector) for selector in selectors]
+        # Only distinct selectors are worth sending to the pool
+        unique = list(dict.fromkeys(selectors)) if len(selectors) > self.parallel_threshold else []
+        pool = get_process_pool() if len(unique) > self.parallel_threshold else None
+        if pool is not None:
+            size = -(-len(unique) // (4 * usable_cpu_count()))
+            chunks = [unique[i : i + size] for i in range(0, len(unique), size)]
+            try:
+                chunk_results = list(pool.map(_validate_selector_chunk, chunks))
+                # Results go through the cache below, so later calls are served from it
+                for chunk, chunk_result in zip(chunks, chunk_results):
+                    self._pool_results.update(zip(chunk, chunk_result))
+            except (OSError, BrokenProcessPool) as e:
+                discard_process_pool()
+                self.logger.warning(
+                    f"Parallel selector validation unavailable, running serially: {e}"
+                )
+
+        results = [self.validate_selector(selector) for selector in selectors]
+        if pool is not None:
+            # Entries for selectors that were already cached are never looked up
+            for selector in unique:
+                self._pool_results.pop(selector, None)
+        return results
 
-    def _determine_selector_type(self, selector: str) -> str:
+    @staticmethod
+    def _has_combinator(selector: str) -> bool:
+        """Check for child, adjacent sibling, or general sibling combinators."""
+        # Chained substring tests run at memchr speed, well ahead of a set or regex scan
+        return ">" in selector or "+" in selector or "~" in selector
+
+    def _determine_selector_type(self, selector: str, has_combinator: Optional[bool] = None) -> str:
         """Determine the type of CSS selector."""
         selector = selector.strip()
+        if has_combinator is None:
+            has_combinator = self._has_combinator(selector)
 
         # Check for combinators first (they can contain other selectors)
-        if ">" in selector or "+" in selector or "~" in selector:
+        if has_combinator:
             return "combinator"
         elif " " in selector:
             return "descendant"
@@ -130,7 +207,8 @@ class SelectorValidator(LoggerMixin):
         Returns tuple of (id_count, class_count, type_count)
         """
         try:
-            # Count IDs
+            # Count IDs. Each str.count is a C-level scan, which measured several
+            # times faster than a single Counter pass over selector-sized strings
             id_count = selector.count("#")
 
             # Count classes, attributes, and pseudo-classes
@@ -143,18 +221,11 @@ class SelectorValidator(LoggerMixin):
 
             # Count type selectors (simplified approach)
             # Remove special characters and count remaining words
-            cleaned = selector
-            for char in ["#", ".", "[", "]", ":", ">", "+", "~", "(", ")"]:
-                cleaned = cleaned.replace(char, " ")
+            cleaned = selector.translate(SELECTOR_PUNCTUATION_TABLE)
 
-            words = [word.strip() for word in cleaned.split() if word.strip()]
             # Filter out pseudo-class/element names and attribute values
             type_words = [
-                word
-                for word in words
-                if not word.startswith(("hover", "focus", "active", "visited", "before", "after"))
-                and not word.isdigit()
-                and len(word) > 0
+                word for word in cleaned.split() if word not in PSEUDO_NAMES and not word.isdigit()
             ]
 
             type_count = len(type_words)
@@ -217,3 +288,17 @@ class SelectorValidator(LoggerMixin):
                     recommendations.append("Universal selector (*) can impact performance")
 
         return analysis
+
+
+def get_selector_validator() -> SelectorValidator:
+    """Get or create the shared selector validator instance."""
+    global _selector_validator
+    if _selector_validator is None:
+        _selector_validator = SelectorValidator()
+    return _selector_validator
+
+
+def _validate_selector_chunk(selectors: List[str]) -> List[SelectorValidationResult]:
+    """Validate one chunk of selectors in a worker process."""
+    validator = get_selector_validator()
+    return [validator._validate_selector(selector) for selector in selectors]
@@ -1,8 +1,15 @@
 """TCSS validator using Textual's native CSS parser."""
 
+import os
+import re
+import sys
 import time
-from typing import List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from hashlib import blake2b
 
 try:
     from textual.css.parse import parse
@@ -17,13 +24,57 @@ try:
 except ImportError as e:
     raise ImportError(f"Failed to import Textual CSS components: {e}")
 
+from ..utils.cache import css_validation_cache
 from ..utils.errors import ValidationError, ParsingError
 from ..utils.logging_config import LoggerMixin, log_validation_result
+from ..utils.parallel import discard_process_pool, get_process_pool, usable_cpu_count
 from ..config import ValidatorConfig
-from .property_validator import TextualPropertyValidator
+from .property_validator import get_property_validator
+
+
+# A line containing a colon whose last non-blank text isn't ";", "{", "}" or "*/"
+MISSING_SEMICOLON_PATTERN = re.compile(r"^[^\n]*:[^\n]*(?<![;{}\s])(?<!\*/)[^\S\n]*$", re.MULTILINE)
+
+# Leading characters of selector parts that aren't type selectors
+NON_TYPE_SELECTOR_PREFIXES = ("#", ".", "[", ":")
+
+# Common colors that could be theme variables instead
+HARDCODED_COLOR_PATTERN = re.compile(r"#(?:ffffff|000000|ff0000)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4)
+def get_variable_tokens(theme_name: str) -> Optional[Dict[str, Any]]:
+    """Build the tokenized CSS variables for a builtin theme, once per theme."""
+    theme = BUILTIN_THEMES.get(theme_name)
+    if not theme:
+        return None
+
+    # Generate CSS variables from the theme
+    color_system = ColorSystem(
+        primary=theme.primary,
+        secondary=theme.secondary,
+        warning=theme.warning,
+        error=theme.error,
+        success=theme.success,
+        accent=theme.accent,
+        foreground=theme.foreground,
+        background=theme.background,
+        surface=theme.surface,
+        panel=theme.panel,
+        boost=theme.boost,
+        dark=theme.dark,
+        luminosity_spread=theme.luminosity_spread,
+        text_alpha=theme.text_alpha,
+        variables=theme.variables,
+    )
+    theme_variables = color_system.generate()
+
+    # Tokenize the theme variables. parse() copies these before substituting, so the
+    # cached tokens can be shared between calls
+    return tokenize_values(theme_variables)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of CSS validation."""
 
@@ -37,7 +88,7 @@ class ValidationResult:
     selector_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectorInfo:
     """Information about a CSS selector."""
 
@@ -50,10 +101,23 @@ class SelectorInfo:
 class TCSSValidator(LoggerMixin):
     """Main TCSS validator using Textual's native parser."""
 
-    def __init__(self, config: ValidatorConfig):
+    def __init__(self, config: ValidatorConfig, parallel_threshold: int = 32):
+        """
+        Initialize the validator.
+
+        Args:
+            config: Validator configuration
+            parallel_threshold: Number of files above which validate_files spreads
+                validation across a process pool
+        """
         self.config = config
+        self.parallel_threshold = parallel_threshold
         self.strict_mode = config.strict_mode
-        self.property_validator = TextualPropertyValidator()
+        self.property_validator = get_property_validator()
+        # Theme variables are the same for every call, so they're tokenized up front
+        self._variable_tokens = get_variable_tokens("textual-dark")
+        # Every parse shares the scope and theme variables, so they're bound once
+        self._parse = partial(parse, "*", variable_tokens=self._variable_tokens)
 
     def validate(self, css_content: str, filename: Optional[str] = None) -> ValidationResult:
         """
@@ -66,7 +130,35 @@ class TCSSValidator(LoggerMixin):
         Returns:
             ValidationResult with errors, warnings, and suggestions
         """
-        start_time = time.time()
+        if not self.config.cache_enabled:
+            return self._validate_uncached(css_content)
+
+        start_ns = time.perf_counter_ns()
+        # Results depend on the content and on the config the checks read
+        key = (
+            blake2b(css_content.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            self.config.max_file_size,
+            self.strict_mode,
+            self.config.collect_suggestions,
+        )
+        result: Optional[ValidationResult] = css_validation_cache.get(key)
+        if result is None:
+            result = self._validate_uncached(css_content)
+            css_validation_cache.put(key, result)
+        else:
+            result = replace(result, parse_time_ms=(time.perf_counter_ns() - start_ns) / 1_000_000)
+
+        # Hand out fresh lists so callers can't alter the cached result
+        return replace(
+            result,
+            errors=list(result.errors),
+            warnings=list(result.warnings),
+            suggestions=list(result.suggestions),
+        )
+
+    def _validate_uncached(self, css_content: str) -> ValidationResult:
+        """Validate TCSS content without consulting the result cache."""
+        start_ns = time.perf_counter_ns()
         errors: List[ValidationError] = []
         warnings: List[ValidationError] = []
         suggestions: List[str] = []
@@ -85,48 +177,13 @@ class TCSSValidator(LoggerMixin):
 
             # Parse CSS using Textual's native parser
             try:
-                # Get default theme variables
-                default_theme = BUILTIN_THEMES.get("textual-dark")
-                if default_theme:
-                    # Generate CSS variables from the theme
-                    color_system = ColorSystem(
-                        primary=default_theme.primary,
-                        secondary=default_theme.secondary,
-                        warning=default_theme.warning,
-                        error=default_theme.error,
-                        success=default_theme.success,
-                        accent=default_theme.accent,
-                        foreground=default_theme.foreground,
-                        background=default_theme.background,
-                        surface=default_theme.surface,
-                        panel=default_theme.panel,
-                        boost=default_theme.boost,
-                        dark=default_theme.dark,
-                        luminosity_spread=default_theme.luminosity_spread,
-                        text_alpha=default_theme.text_alpha,
-                        variables=default_theme.variables,
-                    )
-                    theme_variables = color_system.generate()
-
-                    # Tokenize the theme variables
-                    variable_tokens = tokenize_values(theme_variables)
-                else:
-                    variable_tokens = None
-
                 # Parse with theme variables
-                stylesheet = parse(
-                    "*", css_content, ("inline", "0"), variable_tokens=variable_tokens
-                )
-                # Count rules and selectors
+                stylesheet = self._parse(css_content, ("inline", "0"))
+                # Count rules, then count selectors while performing additional
+                # validation checks
                 rules = list(stylesheet)
                 rule_count = len(rules)
-
-                for rule in rules:
-                    if hasattr(rule, "selectors"):
-                        selector_count += len(rule.selectors)
-
-                # Perform additional validation checks
-                self._validate_stylesheet(stylesheet, errors, warnings, suggestions)
+                selector_count = self._validate_stylesheet(rules, errors, warnings, suggestions)
 
             except StylesheetError as e:
                 errors.append(self._convert_stylesheet_error(e))
@@ -137,8 +194,10 @@ class TCSSValidator(LoggerMixin):
             except Exception as e:
                 errors.append(ParsingError(f"Unexpected parsing error: {str(e)}"))
 
-            # Perform semantic validation if no parsing errors
-            if not errors:
+            # Perform semantic validation if no parsing errors. Its warnings and
+            # suggestions never affect validity, so callers that only need pass/fail
+            # can turn it off outside strict mode
+            if not errors and (self.strict_mode or self.config.collect_suggestions):
                 self._semantic_validation(css_content, warnings, suggestions)
 
             # Always perform property validation (even if there were parsing errors)
@@ -158,26 +217,75 @@ class TCSSValidator(LoggerMixin):
             self.logger.error(f"Validation failed: {e}")
             errors.append(ValidationError(f"Validation failed: {str(e)}"))
 
-        parse_time = time.time() - start_time
+        parse_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Log validation results
-        log_validation_result(len(css_content), len(errors), len(warnings), parse_time)
+        log_validation_result(len(css_content), len(errors), len(warnings), parse_time_ms / 1000)
 
         return self._create_result(
             len(errors) == 0,
             errors,
             warnings,
             suggestions,
-            parse_time * 1000,
+            parse_time_ms,
             rule_count,
             selector_count,
         )
 
     def validate_file(self, file_path: str) -> ValidationResult:
         """Validate a TCSS file."""
+        return self._validate_read(file_path, lambda: self._read_file(file_path))
+
+    def validate_files(self, file_paths: List[str]) -> List[ValidationResult]:
+        """
+        Validate several TCSS files, overlapping file reads with validation.
+
+        Textual's parser is pure Python, so large batches are validated on the shared
+        process pool when at least two CPUs are usable. Otherwise files are read on a
+        thread pool and each one is validated as soon as its read completes, while the
+        remaining reads are still in flight.
+
+        Args:
+            file_paths: Paths of the files to validate
+
+        Returns:
+            One ValidationResult per path, in the order of file_paths
+        """
+        results: List[Optional[ValidationResult]] = [None] * len(file_paths)
+        if not file_paths:
+            return []
+
+        pool = get_process_pool() if len(file_paths) > self.parallel_threshold else None
+        if pool is not None:
+            size = -(-len(file_paths) // (4 * usable_cpu_count()))
+            chunks = [file_paths[i : i + size] for i in range(0, len(file_paths), size)]
+            try:
+                # Each chunk builds its validator once and reuses it for all of its files
+                chunk_results = list(
+                    pool.map(
+                        partial(_validate_file_chunk, self.config, self.strict_mode), chunks
+                    )
+                )
+                return [result for chunk in chunk_results for result in chunk]
+            except (OSError, BrokenProcessPool) as e:
+                discard_process_pool()
+                self.logger.warning(f"Parallel file validation unavailable, running serially: {e}")
+
+        with ThreadPoolExecutor(max_workers=min(len(file_paths), 32)) as executor:
+            futures = {
+                executor.submit(self._read_file, file_path): index
+                for index, file_path in enumerate(file_paths)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = self._validate_read(file_paths[index], future.result)
+
+        return [result for result in results if result is not None]
+
+    def _validate_read(self, file_path: str, read: Callable[[], str]) -> ValidationResult:
+        """Validate the content returned by read, reporting read failures as results."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read()
             result: ValidationResult = self.validate(content, filename=file_path)
             return result
         except FileNotFoundError:
@@ -205,79 +313,149 @@ class TCSSValidator(LoggerMixin):
                 selector_count=0,
             )
 
+    @staticmethod
+    def _read_file(file_path: str) -> str:
+        """Read a UTF-8 text file straight from its descriptor, skipping the buffered IO stack."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            # Regular files come back in one read sized from fstat; keep reading until
+            # EOF in case the file grew or reports no size
+            read_size = max(os.fstat(fd).st_size, 1) + 1
+            chunks = []
+            while chunk := os.read(fd, read_size):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+
+        content = b"".join(chunks).decode("utf-8")
+        # Match text-mode reads, which translate \r\n and \r line endings to \n
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
     def _validate_stylesheet(
         self,
-        stylesheet: Any,
+        rules: List[Any],
         errors: List[ValidationError],
         warnings: List[ValidationError],
         suggestions: List[str],
-    ) -> None:
-        """Perform additional validation on parsed stylesheet."""
+    ) -> int:
+        """
+        Perform additional validation on parsed stylesheet rules in a single pass.
+
+        Returns:
+            Number of selectors across all rules
+        """
+        selector_count = 0
+        # Warnings are gathered per check and reported check by check
+        duplicate_warnings: List[ValidationError] = []
+        specificity_warnings: List[ValidationError] = []
+        empty_rule_warnings: List[ValidationError] = []
+        # Selectors of every rule, and indexes of the rules without declarations
+        rule_selectors: List[List[str]] = []
+        empty_rules: List[int] = []
+
         try:
-            # Check for duplicate selectors
-            selector_map = {}
-            for rule in stylesheet:
-                if hasattr(rule, "selectors"):
-                    for selector in rule.selectors:
-                        selector_str = str(selector)
-                        if selector_str in selector_map:
-                            warnings.append(
-                                ValidationError(
-                                    f"Duplicate selector: {selector_str}",
-                                    selector=selector_str,
-                                )
-                            )
-                        else:
-                            selector_map[selector_str] = rule
-
-            # Check for overly specific selectors
-            for rule in stylesheet:
-                if hasattr(rule, "selectors"):
-                    for selector in rule.selectors:
-                        specificity = self._calculate_specificity(selector)
-                        if specificity[0] > 2:  # Too many IDs
-                            warnings.append(
-                                ValidationError(
-                                    f"Selector has high ID specificity: {selector}",
-                                    selector=str(selector),
-                                )
+            # Only membership matters, so seen selectors are kept in a set
+            seen_selectors = set()
+            for rule in rules:
+                # Textual joins a rule's selectors with ", " and scopes them under "*".
+                # Each selector string is built once here and interned, so the duplicate
+                # map compares repeated selectors by identity
+                selectors = [
+                    sys.intern(selector.removeprefix("* "))
+                    for selector in rule.selectors.split(", ")
+                ]
+                selector_count += len(selectors)
+                rule_selectors.append(selectors)
+
+                for selector_str in selectors:
+                    # Check for duplicate selectors. Adding an already seen selector
+                    # leaves the set's size unchanged, which needs only one set probe
+                    seen_count = len(seen_selectors)
+                    seen_selectors.add(selector_str)
+                    if len(seen_selectors) == seen_count:
+                        duplicate_warnings.append(
+                            ValidationError(
+                                f"Duplicate selector: {selector_str}",
+                                selector=selector_str,
                             )
-                        elif sum(specificity) > 10:  # Overall too specific
-                            suggestions.append(f"Consider simplifying selector: {selector}")
+                        )
 
-            # Check for empty rules
-            for rule in stylesheet:
-                if hasattr(rule, "declarations") and not rule.declarations:
-                    warnings.append(
+                    # Check for overly specific selectors
+                    specificity = self._calculate_specificity(selector_str)
+                    if specificity[0] > 2:  # Too many IDs
+                        specificity_warnings.append(
+                            ValidationError(
+                                f"Selector has high ID specificity: {selector_str}",
+                                selector=selector_str,
+                            )
+                        )
+                    elif sum(specificity) > 10:  # Overall too specific
+                        suggestions.append(f"Consider simplifying selector: {selector_str}")
+
+                # Check for empty rules once the rules nested inside them are known
+                if not rule.styles.get_rules():
+                    empty_rules.append(len(rule_selectors) - 1)
+
+            # Textual gives a nesting parent its own rule without declarations, followed
+            # by rules whose selectors extend it, so only childless empty rules are reported
+            for index in empty_rules:
+                prefixes = tuple(
+                    selector + separator
+                    for selector in rule_selectors[index]
+                    for separator in (" ", ":")
+                )
+                if not any(
+                    selector.startswith(prefixes)
+                    for later in rule_selectors[index + 1 :]
+                    for selector in later
+                ):
+                    empty_rule_warnings.append(
                         ValidationError(
-                            f"Empty rule for selector: {rule.selectors[0] if rule.selectors else 'unknown'}",
-                            selector=str(rule.selectors[0]) if rule.selectors else None,
+                            f"Empty rule for selector: {rule_selectors[index][0]}",
+                            selector=rule_selectors[index][0],
                         )
                     )
 
+            warnings.extend(duplicate_warnings)
+            warnings.extend(specificity_warnings)
+            warnings.extend(empty_rule_warnings)
+
         except Exception as e:
             self.logger.warning(f"Additional validation failed: {e}")
 
+        return selector_count
+
     def _semantic_validation(
         self, css_content: str, warnings: List[ValidationError], suggestions: List[str]
     ) -> None:
         """Perform semantic validation checks."""
-        lines = css_content.split("\n")
-
-        # Check for common issues
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # Check for missing semicolons
-            if ":" in line and not line.endswith((";", "{", "}")):
-                if not line.endswith("*/"):  # Not a comment
-                    warnings.append(
-                        ValidationError("Missing semicolon at end of declaration", line=i)
-                    )
+        # Each check is one scan over the whole content; line numbers are tracked by
+        # counting the newlines between consecutive matches
+
+        # Check for missing semicolons
+        line_num = 1
+        last_pos = 0
+        for match in MISSING_SEMICOLON_PATTERN.finditer(css_content):
+            line_num += css_content.count("\n", last_pos, match.start())
+            last_pos = match.start()
+            warnings.append(
+                ValidationError("Missing semicolon at end of declaration", line=line_num)
+            )
 
-            # Check for color values that could be variables
-            if any(color in line.lower() for color in ["#ffffff", "#000000", "#ff0000"]):
-                suggestions.append(f"Line {i}: Consider using CSS variables for common colors")
+        # Check for color values that could be variables, once per line
+        line_num = 1
+        last_pos = 0
+        suggested_line = 0
+        for match in HARDCODED_COLOR_PATTERN.finditer(css_content):
+            line_num += css_content.count("\n", last_pos, match.start())
+            last_pos = match.start()
+            if line_num != suggested_line:
+                suggestions.append(
+                    f"Line {line_num}: Consider using CSS variables for common colors"
+                )
+                suggested_line = line_num
 
     def _calculate_specificity(self, selector: Any) -> Tuple[int, int, int]:
         """Calculate CSS selector specificity (id, class, type)."""
@@ -286,6 +464,8 @@ class TCSSValidator(LoggerMixin):
             # In a real implementation, you'd parse the selector more thoroughly
             selector_str = str(selector)
 
+            # str.count is a C-level scan per marker, which beats a single Python-level
+            # or NumPy tally on selector-sized strings
             id_count = selector_str.count("#")
             class_count = (
                 selector_str.count(".") + selector_str.count("[") + selector_str.count(":")
@@ -294,7 +474,7 @@ class TCSSValidator(LoggerMixin):
                 [
                     part
                     for part in selector_str.split()
-                    if part and not part.startswith(("#", ".", "[", ":"))
+                    if not part.startswith(NON_TYPE_SELECTOR_PREFIXES)
                 ]
             )
 
@@ -359,3 +539,12 @@ class TCSSValidator(LoggerMixin):
             rule_count=rule_count,
             selector_count=selector_count,
         )
+
+
+def _validate_file_chunk(
+    config: ValidatorConfig, strict_mode: bool, file_paths: List[str]
+) -> List[ValidationResult]:
+    """Validate one chunk of files in a validate_files worker process."""
+    validator = TCSSValidator(config)
+    validator.strict_mode = strict_mode
+    return [validator.validate_file(file_path) for file_path in file_paths]
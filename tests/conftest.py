@@ -14,6 +14,7 @@ from textual_mcp.validators.tcss_validator import TCSSValidator
 from textual_mcp.validators.inline_validator import InlineValidator
 from textual_mcp.validators.selector_validator import SelectorValidator
 from textual_mcp.server import TextualMCPServer
+from textual_mcp.utils.parallel import discard_process_pool
 
 
 @pytest.fixture
@@ -66,9 +67,9 @@ Button {
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config() -> TextualMCPConfig:
-    """Test configuration."""
+    """Test configuration, shared by every test since none of them modify it."""
     return TextualMCPConfig(
         validators=ValidatorConfig(
             strict_mode=False,
@@ -197,6 +198,14 @@ def mcp_client(mcp_server: TextualMCPServer) -> Client:
     return Client(mcp_server.mcp)
 
 
+@pytest.fixture
+def two_cpus(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Report two usable CPUs so the shared process pool is used even on one-CPU hosts."""
+    monkeypatch.setattr(os, "process_cpu_count", lambda: 2, raising=False)
+    yield
+    discard_process_pool()
+
+
 @pytest.fixture
 def event_loop():
     """Create an event loop for async tests."""
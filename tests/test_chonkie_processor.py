@@ -1,16 +1,110 @@
 """Tests for Chonkie-based document processor."""
 
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, patch
 from textual_mcp.search.chonkie_processor import TextualChonkieProcessor
 from textual_mcp.config import TextualMCPConfig
 
+CODE_BLOCKS_MARKDOWN = """# Example
+
+Here's a code example:
+
+```python
+from textual.app import App
+from textual.widgets import Button
+
+class MyApp(App):
+    pass
+```
+
+And another one:
+
+```css
+Button {
+    background: blue;
+}
+```
+"""
+
+TEXT_WITH_CODE_MARKDOWN = """# Title
+
+This is some text with `inline code` and more text.
+
+```python
+code block
+```
+
+More text here."""
+
+CODE_EXAMPLE_DOC = MappingProxyType(
+    {
+        "path": "/docs/examples/button.md",
+        "content": """# Button Example
+
+```python
+from textual.widgets import Button
+button = Button("Click me")
+```
+
+This creates a button widget.
+""",
+        "sha": "abc123",
+        "last_modified": "2024-01-01T00:00:00",
+    }
+)
+
+API_DOC = MappingProxyType(
+    {
+        "path": "/docs/api/button.md",
+        "content": """# Button API
+
+class Button(Widget):
+    def on_click(self):
+        pass
+""",
+        "sha": "abc123",
+        "last_modified": "2024-01-01T00:00:00",
+    }
+)
+
+GUIDE_DOC = MappingProxyType(
+    {
+        "path": "/docs/guide/widgets.md",
+        "content": """# Widgets Guide
+
+## Introduction
+
+Learn about Textual widgets.
+""",
+        "sha": "abc123",
+        "last_modified": "2024-01-01T00:00:00",
+    }
+)
+
+CSS_REFERENCE_DOC = MappingProxyType(
+    {
+        "path": "/docs/css/properties.md",
+        "content": """# CSS Properties
+
+Button {
+    background: blue;
+    margin: 1;
+}
+""",
+        "sha": "abc123",
+        "last_modified": "2024-01-01T00:00:00",
+    }
+)
+
 
 class TestTextualChonkieProcessor:
     """Test cases for TextualChonkieProcessor."""
 
-    @pytest.fixture
-    def config(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
         """Create a test configuration."""
         config = TextualMCPConfig()
         config.search.chunking_strategy = "chonkie"
@@ -18,9 +112,10 @@ class TestTextualChonkieProcessor:
         config.search.chunk_overlap = 50
         return config
 
-    @pytest.fixture
-    def processor(self, config):
-        """Create a processor instance for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def processor(cls, config):
+        """Create a processor instance shared by the tests in this class."""
         # Mock all Chonkie imports to avoid dependency issues in tests
         with (
             patch("textual_mcp.search.chonkie_processor.RecursiveChunker") as mock_recursive,
@@ -47,7 +142,23 @@ class TestTextualChonkieProcessor:
                 "overlap": mock_overlap,
             }
 
-            return processor
+            # Keep the patches active so tests can configure chunkers the processor
+            # builds on demand through the stored class mocks
+            yield processor
+
+    @pytest.fixture(autouse=True)
+    def reset_chunkers(self, processor):
+        """Clear chunker mocks configured by a test so the shared processor starts clean."""
+        yield
+        for chunker in (
+            processor.markdown_chunker,
+            processor.semantic_chunker,
+            processor.sentence_chunker,
+            processor.code_chunker,
+            processor.overlap_refinery,
+        ):
+            chunker.reset_mock(return_value=True, side_effect=True)
+        processor._mock_chunkers["semantic"].return_value = processor.semantic_chunker
 
     def test_initialization(self, processor, config):
         """Test processor initialization."""
@@ -58,39 +169,24 @@ class TestTextualChonkieProcessor:
         assert processor.code_chunker is not None
         assert processor.overlap_refinery is not None
 
-    def test_determine_content_type(self, processor):
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/docs/guide/intro.md", "guide"),
+            ("/docs/api/widgets.md", "api"),
+            ("/docs/widgets/button.md", "widget"),
+            ("/docs/examples/app.md", "code"),
+            ("/docs/css/styles.md", "css_reference"),
+            ("/docs/other.md", "documentation"),
+        ],
+    )
+    def test_determine_content_type(self, processor, path, expected):
         """Test content type determination."""
-        assert processor._determine_content_type("/docs/guide/intro.md") == "guide"
-        assert processor._determine_content_type("/docs/api/widgets.md") == "api"
-        assert processor._determine_content_type("/docs/widgets/button.md") == "widget"
-        assert processor._determine_content_type("/docs/examples/app.md") == "code"
-        assert processor._determine_content_type("/docs/css/styles.md") == "css_reference"
-        assert processor._determine_content_type("/docs/other.md") == "documentation"
+        assert processor._determine_content_type(path) == expected
 
     def test_extract_code_blocks(self, processor):
         """Test code block extraction from markdown."""
-        content = """# Example
-
-Here's a code example:
-
-```python
-from textual.app import App
-from textual.widgets import Button
-
-class MyApp(App):
-    pass
-```
-
-And another one:
-
-```css
-Button {
-    background: blue;
-}
-```
-"""
-
-        blocks = processor._extract_code_blocks(content)
+        blocks = processor._extract_code_blocks(CODE_BLOCKS_MARKDOWN)
 
         assert len(blocks) == 2
         assert blocks[0]["language"] == "python"
@@ -100,17 +196,7 @@ Button {
 
     def test_extract_text_content(self, processor):
         """Test non-code text extraction."""
-        content = """# Title
-
-This is some text with `inline code` and more text.
-
-```python
-code block
-```
-
-More text here."""
-
-        text = processor._extract_text_content(content)
+        text = processor._extract_text_content(TEXT_WITH_CODE_MARKDOWN)
 
         assert "This is some text with  and more text." in text
         assert "code block" not in text
@@ -167,133 +253,109 @@ The `margin` property sets margins.
         assert "border" in properties
         assert "margin" in properties
 
-    def test_process_document_code_type(self, processor):
-        """Test processing a code example document."""
-        doc_data = {
-            "path": "/docs/examples/button.md",
-            "content": """# Button Example
-
-```python
-from textual.widgets import Button
-button = Button("Click me")
-```
-
-This creates a button widget.
-""",
-            "sha": "abc123",
-            "last_modified": "2024-01-01T00:00:00",
-        }
-
-        # Mock chunker responses
-        mock_chunk = Mock()
-        mock_chunk.text = 'from textual.widgets import Button\nbutton = Button("Click me")'
-        mock_chunk.token_count = 20
-
-        processor.code_chunker.chunk = Mock(return_value=[mock_chunk])
-        processor.sentence_chunker.chunk = Mock(
-            return_value=[Mock(text="This creates a button widget.", token_count=10)]
-        )
-
-        chunks = processor._chunk_code_content(doc_data)
-
-        assert len(chunks) > 0
-        # Should have both code and explanation chunks
-        code_chunks = [c for c in chunks if c["metadata"]["content_type"] == "code"]
-        explanation_chunks = [
-            c for c in chunks if c["metadata"]["content_type"] == "code_explanation"
-        ]
-
-        assert len(code_chunks) > 0
-        assert len(explanation_chunks) > 0
-
-    def test_process_document_api_type(self, processor):
-        """Test processing an API documentation."""
-        doc_data = {
-            "path": "/docs/api/button.md",
-            "content": """# Button API
-
-class Button(Widget):
-    def on_click(self):
-        pass
-""",
-            "sha": "abc123",
-            "last_modified": "2024-01-01T00:00:00",
-        }
-
-        # Mock semantic chunker
-        mock_chunk = Mock()
-        mock_chunk.text = "class Button(Widget):\n    def on_click(self):"
-        mock_chunk.token_count = 15
-
-        # Create a temporary semantic chunker for this test
-        with patch("textual_mcp.search.chonkie_processor.SemanticChunker") as mock_semantic_class:
-            mock_api_chunker = Mock()
-            mock_api_chunker.chunk = Mock(return_value=[mock_chunk])
-            mock_semantic_class.return_value = mock_api_chunker
-
-            chunks = processor._chunk_api_documentation(doc_data)
-
-        assert len(chunks) > 0
-        assert chunks[0]["metadata"]["content_type"] == "api"
-        assert chunks[0]["metadata"]["class_name"] == "Button"
-        assert "on_click" in chunks[0]["metadata"]["methods"]
-
-    def test_process_document_guide_type(self, processor):
-        """Test processing a guide document."""
-        doc_data = {
-            "path": "/docs/guide/widgets.md",
-            "content": """# Widgets Guide
-
-## Introduction
-
-Learn about Textual widgets.
-""",
-            "sha": "abc123",
-            "last_modified": "2024-01-01T00:00:00",
-        }
-
-        mock_chunk = Mock()
-        mock_chunk.text = "# Widgets Guide\n\n## Introduction\n\nLearn about Textual widgets."
-        mock_chunk.token_count = 20
-
-        processor.markdown_chunker.chunk = Mock(return_value=[mock_chunk])
-
-        chunks = processor._chunk_guide_content(doc_data)
-
-        assert len(chunks) > 0
-        assert chunks[0]["metadata"]["content_type"] == "guide"
-        assert "hierarchy" in chunks[0]["metadata"]
-
-    def test_process_document_css_type(self, processor):
-        """Test processing CSS reference documentation."""
-        doc_data = {
-            "path": "/docs/css/properties.md",
-            "content": """# CSS Properties
-
-Button {
-    background: blue;
-    margin: 1;
-}
-""",
-            "sha": "abc123",
-            "last_modified": "2024-01-01T00:00:00",
-        }
-
-        # Create a mock for CSS chunking
-        with patch("textual_mcp.search.chonkie_processor.SemanticChunker") as mock_semantic_class:
-            mock_css_chunker = Mock()
-            mock_chunk = Mock()
-            mock_chunk.text = "Button {\n    background: blue;\n    margin: 1;\n}"
-            mock_chunk.token_count = 15
-            mock_css_chunker.chunk = Mock(return_value=[mock_chunk])
-            mock_semantic_class.return_value = mock_css_chunker
-
-            chunks = processor._chunk_css_reference(doc_data)
+    @pytest.mark.parametrize(
+        "method_name, doc_data, chunker_results, content_types, metadata, metadata_members",
+        [
+            pytest.param(
+                "_chunk_code_content",
+                CODE_EXAMPLE_DOC,
+                {
+                    "code": [
+                        SimpleNamespace(
+                            text='from textual.widgets import Button\nbutton = Button("Click me")',
+                            token_count=20,
+                        )
+                    ],
+                    "sentence": [
+                        SimpleNamespace(text="This creates a button widget.", token_count=10)
+                    ],
+                },
+                # Should have both code and explanation chunks
+                {"code", "code_explanation"},
+                {},
+                {},
+                id="code",
+            ),
+            pytest.param(
+                "_chunk_api_documentation",
+                API_DOC,
+                {
+                    "semantic": [
+                        SimpleNamespace(
+                            text="class Button(Widget):\n    def on_click(self):", token_count=15
+                        )
+                    ]
+                },
+                {"api"},
+                {"content_type": "api", "class_name": "Button"},
+                {"methods": ["on_click"]},
+                id="api",
+            ),
+            pytest.param(
+                "_chunk_guide_content",
+                GUIDE_DOC,
+                {
+                    "markdown": [
+                        SimpleNamespace(
+                            text="# Widgets Guide\n\n## Introduction\n\nLearn about Textual widgets.",
+                            token_count=20,
+                        )
+                    ]
+                },
+                {"guide"},
+                {"content_type": "guide"},
+                {"hierarchy": []},
+                id="guide",
+            ),
+            pytest.param(
+                "_chunk_css_reference",
+                CSS_REFERENCE_DOC,
+                {
+                    "semantic": [
+                        SimpleNamespace(
+                            text="Button {\n    background: blue;\n    margin: 1;\n}",
+                            token_count=15,
+                        )
+                    ]
+                },
+                {"css_reference"},
+                {"content_type": "css_reference"},
+                {"css_properties": ["background", "margin"]},
+                id="css",
+            ),
+        ],
+    )
+    def test_process_document_by_type(
+        self,
+        processor,
+        method_name,
+        doc_data,
+        chunker_results,
+        content_types,
+        metadata,
+        metadata_members,
+    ):
+        """Test processing each document type with its chunker."""
+        for chunker_name, results in chunker_results.items():
+            if chunker_name == "semantic":
+                # API and CSS docs build their own chunker through the patched class
+                processor._mock_chunkers["semantic"].return_value = Mock(
+                    chunk=Mock(return_value=results)
+                )
+            else:
+                getattr(processor, f"{chunker_name}_chunker").chunk = Mock(return_value=results)
+
+        chunks = getattr(processor, method_name)(doc_data)
 
         assert len(chunks) > 0
-        assert chunks[0]["metadata"]["content_type"] == "css_reference"
-        assert "background" in chunks[0]["metadata"]["css_properties"]
-        assert "margin" in chunks[0]["metadata"]["css_properties"]
+        assert content_types <= {chunk["metadata"]["content_type"] for chunk in chunks}
+        first_metadata = chunks[0]["metadata"]
+        for key, value in metadata.items():
+            assert first_metadata[key] == value
+        for key, members in metadata_members.items():
+            assert key in first_metadata
+            for member in members:
+                assert member in first_metadata[key]
 
     def test_add_overlap_context(self, processor):
         """Test adding overlap context to chunks."""
@@ -325,9 +387,7 @@ Button {
         processor.semantic_chunker.chunk = Mock(side_effect=Exception("Semantic chunking failed"))
 
         # Mock sentence chunker
-        mock_chunk = Mock()
-        mock_chunk.text = "Some general documentation content."
-        mock_chunk.token_count = 10
+        mock_chunk = SimpleNamespace(text="Some general documentation content.", token_count=10)
         processor.sentence_chunker.chunk = Mock(return_value=[mock_chunk])
 
         chunks = processor._chunk_general_content(doc_data)
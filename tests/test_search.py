@@ -1,34 +1,81 @@
 """Tests for vector search functionality."""
 
+from types import MappingProxyType
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from pathlib import Path
-import tempfile
 
 from textual_mcp.search.memory import TextualDocsMemory
 from textual_mcp.search.document_processor import TextualDocumentProcessor
 
+GUIDE_WITH_CODE_DOC = MappingProxyType(
+    {
+        "path": "/docs/guide/widgets.md",
+        "content": """# Widgets in Textual
+
+## Introduction
+
+Textual provides many built-in widgets for creating TUI applications.
+
+```python
+from textual.widgets import Button
+
+button = Button("Click me!")
+```
+
+## Button Widget
+
+The Button widget creates a clickable button.
+""",
+        "sha": "abc123",
+        "last_modified": "2024-01-01T00:00:00",
+    }
+)
+
+# Mocked GitHub API responses for the documentation fetch test
+TREE_RESPONSE = Mock(
+    **{
+        "json.return_value": {
+            "tree": [{"path": "docs/guide/intro.md", "type": "blob", "sha": "abc123"}]
+        },
+        "raise_for_status": Mock(),
+    }
+)
+CONTENT_RESPONSE = Mock(
+    **{
+        "json.return_value": {"content": "IyBJbnRyb2R1Y3Rpb24="},  # Base64 "# Introduction"
+        "raise_for_status": Mock(),
+    }
+)
+
 
 class TestTextualDocsMemory:
     """Test cases for TextualDocsMemory."""
 
-    @pytest.fixture
-    def memory(self):
-        """Create a memory instance for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch("vectordb.Memory") as mock_memory_class:
-                # Create a mock Memory instance
-                mock_memory = Mock()
-                mock_memory.memory = []
-                mock_memory.search.return_value = []
-                mock_memory_class.return_value = mock_memory
-
-                memory = TextualDocsMemory(
-                    embeddings="sentence-transformers/all-MiniLM-L6-v2",
-                    persist_path=Path(tmpdir) / "test.db",
-                )
-                memory._mock_memory = mock_memory  # Store reference for tests
-                yield memory
+    @pytest.fixture(scope="class")
+    @classmethod
+    def memory(cls):
+        """Create a memory instance shared by the tests in this class."""
+        with patch("vectordb.Memory") as mock_memory_class:
+            # Create a mock Memory instance
+            mock_memory = Mock()
+            mock_memory_class.return_value = mock_memory
+
+            memory = TextualDocsMemory(
+                embeddings="sentence-transformers/all-MiniLM-L6-v2",
+                # vectordb.Memory is patched, so nothing is ever written to this path
+                persist_path=Path("test.db"),
+            )
+            memory._mock_memory = mock_memory  # Store reference for tests
+            yield memory
+
+    @pytest.fixture(autouse=True)
+    def reset_memory(self, memory):
+        """Start each test with an empty mock index."""
+        memory._mock_memory.reset_mock(return_value=True, side_effect=True)
+        memory._mock_memory.memory = []
+        memory._mock_memory.search.return_value = []
 
     def test_initialization(self, memory):
         """Test memory initialization."""
@@ -137,14 +184,20 @@ class TestTextualDocumentProcessor:
         assert processor.chunk_overlap == 10
         assert processor.github_token is None
 
-    def test_determine_content_type(self, processor):
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/docs/guide/intro.md", "guide"),
+            ("/docs/api/widgets.md", "api"),
+            ("/docs/widgets/button.md", "widget"),
+            ("/docs/examples/app.md", "example"),
+            ("/docs/css/styles.md", "css_reference"),
+            ("/docs/other.md", "documentation"),
+        ],
+    )
+    def test_determine_content_type(self, processor, path, expected):
         """Test content type determination."""
-        assert processor._determine_content_type("/docs/guide/intro.md") == "guide"
-        assert processor._determine_content_type("/docs/api/widgets.md") == "api"
-        assert processor._determine_content_type("/docs/widgets/button.md") == "widget"
-        assert processor._determine_content_type("/docs/examples/app.md") == "example"
-        assert processor._determine_content_type("/docs/css/styles.md") == "css_reference"
-        assert processor._determine_content_type("/docs/other.md") == "documentation"
+        assert processor._determine_content_type(path) == expected
 
     def test_split_text_with_overlap(self, processor):
         """Test text splitting with overlap."""
@@ -160,41 +213,16 @@ class TestTextualDocumentProcessor:
         chunks = processor._split_text_with_overlap(long_text)
 
         assert len(chunks) > 1
-        # Check overlap exists
-        for i in range(len(chunks) - 1):
-            chunk1_words = chunks[i].split()
-            chunk2_words = chunks[i + 1].split()
-            # Some words from end of chunk1 should be at start of chunk2
-            assert any(
-                w in chunk2_words[: processor.chunk_overlap]
-                for w in chunk1_words[-processor.chunk_overlap :]
-            )
+        # Check overlap exists: some words from the end of each chunk should be at
+        # the start of the next one
+        split_chunks = [chunk.split() for chunk in chunks]
+        for current_words, next_words in zip(split_chunks, split_chunks[1:]):
+            prefix = frozenset(next_words[: processor.chunk_overlap])
+            assert not prefix.isdisjoint(current_words[-processor.chunk_overlap :])
 
     def test_process_document(self, processor):
         """Test document processing."""
-        doc_data = {
-            "path": "/docs/guide/widgets.md",
-            "content": """# Widgets in Textual
-
-## Introduction
-
-Textual provides many built-in widgets for creating TUI applications.
-
-```python
-from textual.widgets import Button
-
-button = Button("Click me!")
-```
-
-## Button Widget
-
-The Button widget creates a clickable button.
-""",
-            "sha": "abc123",
-            "last_modified": "2024-01-01T00:00:00",
-        }
-
-        chunks = processor.process_document(doc_data)
+        chunks = processor.process_document(GUIDE_WITH_CODE_DOC)
 
         assert len(chunks) > 0
 
@@ -214,26 +242,9 @@ The Button widget creates a clickable button.
     async def test_fetch_documentation_mock(self, processor):
         """Test documentation fetching with mocked GitHub API."""
         with patch("httpx.AsyncClient") as mock_client:
-            # Mock the tree response
-            mock_tree_response = Mock()
-            mock_tree_response.json.return_value = {
-                "tree": [{"path": "docs/guide/intro.md", "type": "blob", "sha": "abc123"}]
-            }
-            mock_tree_response.raise_for_status = Mock()
-
-            # Mock the content response
-            mock_content_response = Mock()
-            mock_content_response.json.return_value = {
-                "content": "IyBJbnRyb2R1Y3Rpb24="  # Base64 encoded "# Introduction"
-            }
-            mock_content_response.raise_for_status = Mock()
-
             # Set up the mock client
             mock_client_instance = AsyncMock()
-            mock_client_instance.get.side_effect = [
-                mock_tree_response,
-                mock_content_response,
-            ]
+            mock_client_instance.get.side_effect = [TREE_RESPONSE, CONTENT_RESPONSE]
             mock_client.return_value.__aenter__.return_value = mock_client_instance
 
             # Fetch documentation
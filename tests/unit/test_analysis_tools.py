@@ -1,12 +1,31 @@
 """Tests for analysis tools module."""
 
 import pytest
+from typing import Any, Callable, Dict
 from unittest.mock import MagicMock
 
 from textual_mcp.tools.analysis_tools import register_analysis_tools
 from textual_mcp.config import TextualMCPConfig
 
 
+@pytest.fixture(scope="module")
+def registered_tools(test_config: TextualMCPConfig) -> Dict[str, Callable[..., Any]]:
+    """Register the analysis tools once and collect them by name."""
+    mock_mcp = MagicMock()
+    tools: Dict[str, Callable[..., Any]] = {}
+
+    def tool_decorator():
+        def decorator(func):
+            tools[func.__name__] = func
+            return func
+
+        return decorator
+
+    mock_mcp.tool = tool_decorator
+    register_analysis_tools(mock_mcp, test_config)
+    return tools
+
+
 class TestAnalysisTools:
     """Test analysis tool registration and functionality."""
 
@@ -23,21 +42,10 @@ class TestAnalysisTools:
         assert mock_mcp.tool.call_count >= 1
 
     @pytest.mark.asyncio
-    async def test_detect_style_conflicts_tool_logic(self, test_config: TextualMCPConfig):
+    async def test_detect_style_conflicts_tool_logic(
+        self, registered_tools: Dict[str, Callable[..., Any]]
+    ):
         """Test the detect_style_conflicts tool implementation logic."""
-        mock_mcp = MagicMock()
-        registered_tools = {}
-
-        def tool_decorator():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return decorator
-
-        mock_mcp.tool = tool_decorator
-        register_analysis_tools(mock_mcp, test_config)
-
         detect_style_conflicts = registered_tools["detect_style_conflicts"]
 
         # Test with CSS containing potential conflicts
@@ -75,21 +83,8 @@ class TestAnalysisTools:
         assert isinstance(result["resolution_suggestions"], list)
 
     @pytest.mark.asyncio
-    async def test_tool_error_handling(self, test_config: TextualMCPConfig):
+    async def test_tool_error_handling(self, registered_tools: Dict[str, Callable[..., Any]]):
         """Test error handling in analysis tools."""
-        mock_mcp = MagicMock()
-        registered_tools = {}
-
-        def tool_decorator():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return decorator
-
-        mock_mcp.tool = tool_decorator
-        register_analysis_tools(mock_mcp, test_config)
-
         # For now, since these are TODO implementations, they shouldn't raise errors
         # Test that they handle various inputs gracefully
 
@@ -1,33 +1,62 @@
 """Integration tests for conflict detection in analysis tools."""
 
 import pytest
+from functools import partial
+from typing import Any, Callable, Dict
 
 from textual_mcp.tools.analysis_tools import register_analysis_tools
 from textual_mcp.config import TextualMCPConfig
 
 
+def _register_tool(
+    tools: Dict[str, Callable[..., Any]], func: Callable[..., Any]
+) -> Callable[..., Any]:
+    """Record a decorated tool function under its name."""
+    tools[func.__name__] = func
+    return func
+
+
 class MockMCP:
     """Mock MCP server for testing tools."""
 
+    __slots__ = ("tools",)
+
     def __init__(self):
-        self.tools = {}
+        self.tools: Dict[str, Callable[..., Any]] = {}
 
     def tool(self):
         """Decorator to register tools."""
+        return partial(_register_tool, self.tools)
+
 
-        def decorator(func):
-            self.tools[func.__name__] = func
-            return func
+@pytest.fixture(scope="module")
+def large_css() -> str:
+    """Generate a larger CSS file with potential conflicts, once per module."""
+    css_parts = []
+    for i in range(50):
+        css_parts.append(f"""
+            .class{i} {{
+                color: #{i:06x};
+                margin: {i} {i * 2};
+                padding: {i // 2};
+            }}
+
+            Button.class{i} {{
+                color: #{(i + 1):06x};
+                margin-top: {i + 1};
+            }}
+            """)
 
-        return decorator
+    return "\n".join(css_parts)
 
 
 class TestDetectStyleConflictsTool:
     """Test the detect_style_conflicts MCP tool."""
 
-    @pytest.fixture
-    def mcp_with_tools(self, test_config: TextualMCPConfig) -> MockMCP:
-        """Create mock MCP with analysis tools registered."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mcp_with_tools(cls, test_config: TextualMCPConfig) -> MockMCP:
+        """Create mock MCP with analysis tools registered once for the class."""
         mcp = MockMCP()
         register_analysis_tools(mcp, test_config)
         return mcp
@@ -269,30 +298,12 @@ class TestDetectStyleConflictsTool:
         assert any(prop in all_conflicting_props for prop in textual_props)
 
     @pytest.mark.asyncio
-    async def test_large_css_performance(self, mcp_with_tools: MockMCP):
+    async def test_large_css_performance(self, mcp_with_tools: MockMCP, large_css: str):
         """Test performance with larger CSS files."""
         tool = mcp_with_tools.tools["detect_style_conflicts"]
 
-        # Generate a larger CSS file with potential conflicts
-        css_parts = []
-        for i in range(50):
-            css_parts.append(f"""
-            .class{i} {{
-                color: #{i:06x};
-                margin: {i} {i * 2};
-                padding: {i // 2};
-            }}
-
-            Button.class{i} {{
-                color: #{(i + 1):06x};
-                margin-top: {i + 1};
-            }}
-            """)
-
-        css_content = "\n".join(css_parts)
-
         # Should complete without timing out
-        result = await tool(css_content)
+        result = await tool(large_css)
 
         assert isinstance(result, dict)
         assert "summary" in result
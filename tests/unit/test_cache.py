@@ -1,17 +1,37 @@
 """Tests for cache utilities."""
 
+import pytest
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import SimpleQueue
+from types import SimpleNamespace
+from typing import Callable
 
+from textual_mcp.utils import cache as cache_module
 from textual_mcp.utils.cache import (
     LRUCache,
     CacheManager,
     cache_key,
     cached,
     cache_manager,
+    css_validation_cache,
+    documentation_cache,
+    embedding_cache,
 )
 
 
+@pytest.fixture
+def advance(monkeypatch: pytest.MonkeyPatch) -> Callable[[float], None]:
+    """Drive cache timestamps from a fake clock; returns a function that moves it forward."""
+    clock = [0.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: clock[0]))
+
+    def advance_clock(seconds: float) -> None:
+        clock[0] += seconds
+
+    return advance_clock
+
+
 class TestLRUCache:
     """Test cases for LRUCache implementation."""
 
@@ -114,31 +134,43 @@ class TestLRUCache:
         assert cache.get("key2") is None
         assert cache.get("key3") is None
 
-    def test_cache_ttl_expiration(self):
+    def test_cache_ttl_expiration(self, advance: Callable[[float], None]):
         """Test TTL expiration."""
         cache = LRUCache[str, str](ttl=0.1)  # 100ms TTL
 
         cache.put("key1", "value1")
         assert cache.get("key1") == "value1"
 
+        # Move past expiration
+        advance(0.15)
+        assert cache.get("key1") is None
+
+    @pytest.mark.slow
+    def test_cache_ttl_expiration_real_clock(self):
+        """Test TTL expiration against the real clock."""
+        cache = LRUCache[str, str](ttl=0.05)  # 50ms TTL
+
+        cache.put("key1", "value1")
+        assert cache.get("key1") == "value1"
+
         # Wait for expiration
-        time.sleep(0.15)
+        time.sleep(0.1)
         assert cache.get("key1") is None
 
-    def test_cache_cleanup_expired(self):
+    def test_cache_cleanup_expired(self, advance: Callable[[float], None]):
         """Test cleanup_expired method."""
         cache = LRUCache[str, str](ttl=0.1)  # 100ms TTL
 
         # Add multiple items
         cache.put("key1", "value1")
         cache.put("key2", "value2")
-        time.sleep(0.05)  # Wait 50ms
+        advance(0.05)  # 50ms later
         cache.put("key3", "value3")  # This one is newer
 
         assert cache.size() == 3
 
-        # Wait for first two to expire (but not the third)
-        time.sleep(0.06)  # Total 0.11s for first two, 0.06s for third
+        # Move far enough for the first two to expire (but not the third)
+        advance(0.06)  # Total 0.11s for first two, 0.06s for third
 
         # Cleanup expired
         expired_count = cache.cleanup_expired()
@@ -160,28 +192,33 @@ class TestLRUCache:
     def test_cache_thread_safety(self):
         """Test thread safety of cache operations."""
         cache = LRUCache[int, int](max_size=100)
-        errors = []
+        errors: SimpleQueue[str] = SimpleQueue()
+        thread_count = 8
+        ops_per_thread = 1000
+        barrier = threading.Barrier(thread_count)
 
         def worker(start: int, count: int):
             try:
+                # Release every worker at once so puts and gets actually contend
+                barrier.wait()
                 for i in range(start, start + count):
                     cache.put(i, i * 2)
                     value = cache.get(i)
                     if value is not None and value != i * 2:
-                        errors.append(f"Incorrect value for key {i}: {value}")
+                        errors.put(f"Incorrect value for key {i}: {value}")
             except Exception as e:
-                errors.append(str(e))
-
-        # Run multiple threads
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for i in range(10):
-                futures.append(executor.submit(worker, i * 10, 10))
-
-            for future in as_completed(futures):
-                future.result()
-
-        assert len(errors) == 0
+                errors.put(str(e))
+
+        threads = [
+            threading.Thread(target=worker, args=(i * ops_per_thread, ops_per_thread))
+            for i in range(thread_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors.empty()
         # Cache should have at most max_size items
         assert cache.size() <= 100
 
@@ -232,7 +269,8 @@ class TestCacheKey:
 
         # Should produce a valid hash
         assert isinstance(key, str)
-        assert len(key) == 32  # MD5 hex digest length
+        assert len(key) == 32  # 128-bit digest as hex
+        assert all(c in "0123456789abcdef" for c in key)
 
 
 class TestCachedDecorator:
@@ -315,10 +353,13 @@ class TestCachedDecorator:
 class TestCacheManager:
     """Test CacheManager functionality."""
 
-    def test_cache_manager_create_cache(self):
-        """Test creating named caches."""
-        manager = CacheManager()
+    @pytest.fixture
+    def manager(self) -> CacheManager:
+        """Create an empty cache manager."""
+        return CacheManager()
 
+    def test_cache_manager_create_cache(self, manager: CacheManager):
+        """Test creating named caches."""
         cache1 = manager.create_cache("cache1", max_size=50, ttl=60)
         cache2 = manager.create_cache("cache2", max_size=100)
 
@@ -330,20 +371,16 @@ class TestCacheManager:
         assert cache2.max_size == 100
         assert cache2.ttl is None
 
-    def test_cache_manager_get_cache(self):
+    def test_cache_manager_get_cache(self, manager: CacheManager):
         """Test getting caches by name."""
-        manager = CacheManager()
-
         cache1 = manager.create_cache("test_cache")
         retrieved = manager.get_cache("test_cache")
 
         assert retrieved is cache1
         assert manager.get_cache("nonexistent") is None
 
-    def test_cache_manager_clear_all(self):
+    def test_cache_manager_clear_all(self, manager: CacheManager):
         """Test clearing all caches."""
-        manager = CacheManager()
-
         cache1 = manager.create_cache("cache1")
         cache2 = manager.create_cache("cache2")
 
@@ -358,10 +395,10 @@ class TestCacheManager:
         assert cache1.size() == 0
         assert cache2.size() == 0
 
-    def test_cache_manager_cleanup_expired(self):
+    def test_cache_manager_cleanup_expired(
+        self, manager: CacheManager, advance: Callable[[float], None]
+    ):
         """Test cleaning up expired items from all caches."""
-        manager = CacheManager()
-
         cache1 = manager.create_cache("cache1", ttl=0.1)
         cache2 = manager.create_cache("cache2", ttl=0.1)
         cache3 = manager.create_cache("cache3")  # No TTL
@@ -371,8 +408,8 @@ class TestCacheManager:
         cache2.put("key2", "value2")
         cache3.put("key3", "value3")
 
-        # Wait for expiration
-        time.sleep(0.15)
+        # Move past expiration
+        advance(0.15)
 
         results = manager.cleanup_all_expired()
 
@@ -384,10 +421,8 @@ class TestCacheManager:
         assert cache2.size() == 0
         assert cache3.size() == 1
 
-    def test_cache_manager_get_stats(self):
+    def test_cache_manager_get_stats(self, manager: CacheManager):
         """Test getting statistics for all caches."""
-        manager = CacheManager()
-
         cache1 = manager.create_cache("cache1", max_size=50, ttl=60)
         cache2 = manager.create_cache("cache2", max_size=100)
 
@@ -416,12 +451,6 @@ class TestGlobalCacheManager:
 
     def test_default_caches_exist(self):
         """Test that default caches are created."""
-        from textual_mcp.utils.cache import (
-            css_validation_cache,
-            documentation_cache,
-            embedding_cache,
-        )
-
         assert isinstance(css_validation_cache, LRUCache)
         assert css_validation_cache.max_size == 100
         assert css_validation_cache.ttl == 3600
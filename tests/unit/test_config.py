@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 import yaml
+from typing import Any, Dict
 
 from textual_mcp.config import (
     TextualMCPConfig,
@@ -23,46 +24,125 @@ from textual_mcp.config import (
 )
 
 
-class TestConfigClasses:
-    """Test configuration model classes."""
-
-    def test_validator_config_defaults(self):
-        """Test ValidatorConfig default values."""
-        config = ValidatorConfig()
-
-        assert config.strict_mode is False
-        assert config.cache_enabled is True
-        assert config.max_file_size == 1048576  # 1MB
-        assert config.timeout == 30
-
-    def test_embedding_config_defaults(self):
-        """Test EmbeddingConfig default values."""
-        config = EmbeddingConfig()
-
-        assert config.model == "all-MiniLM-L6-v2"
-        assert config.dimension == 384
-        assert config.batch_size == 32
+# Config files written by the loading tests, dumped once at import
+BASIC_CONFIG_YAML = yaml.dump(
+    {
+        "validators": {
+            "strict_mode": True,
+            "cache_enabled": False,
+        },
+        "logging": {
+            "level": "DEBUG",
+            "file": "custom.log",
+        },
+    }
+)
+BAD_NUMBER_CONFIG_YAML = yaml.dump(
+    {
+        "validators": {
+            "max_file_size": "not_a_number",
+        },
+    }
+)
+ENV_OVERRIDE_CONFIG_YAML = yaml.dump(
+    {
+        "search": {
+            "persist_path": "./original/path.db",
+            "embeddings_model": "original-model",
+        },
+        "logging": {
+            "level": "INFO",
+        },
+    }
+)
 
-    def test_indexing_config_defaults(self):
-        """Test IndexingConfig default values."""
-        config = IndexingConfig()
+# libyaml's C loader when PyYAML was built with it; same safe semantics either way
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Default top-level config, built once; tests only read it
+DEFAULT_CONFIG = TextualMCPConfig()
+
+# Every environment variable _get_env_overrides reads
+OVERRIDE_ENV_VARS = (
+    "TEXTUAL_SEARCH_EMBEDDINGS_MODEL",
+    "TEXTUAL_SEARCH_PERSIST_PATH",
+    "GITHUB_TOKEN",
+    "EMBEDDINGS_MODEL",
+    "EMBEDDINGS_STORE",
+    "LOG_LEVEL",
+    "LOG_FILE",
+    "CACHE_SIZE",
+    "MAX_CONCURRENT_REQUESTS",
+)
 
-        assert config.chunk_size == 512
-        assert config.chunk_overlap == 50
-        assert config.doc_types == ["api", "guide", "example", "css_reference"]
 
-    def test_search_config_defaults(self):
-        """Test SearchConfig default values."""
-        config = SearchConfig()
+class TestConfigClasses:
+    """Test configuration model classes."""
 
-        assert config.auto_index is True
-        assert config.embeddings_model == "BAAI/bge-base-en-v1.5"
-        assert config.persist_path == "./data/textual_docs.db"
-        assert config.chunk_size == 200
-        assert config.chunk_overlap == 20
-        assert config.github_token is None
-        assert config.default_limit == 10
-        assert config.similarity_threshold == 0.7
+    @pytest.mark.parametrize(
+        "config_class, expected",
+        [
+            pytest.param(
+                ValidatorConfig,
+                {
+                    "strict_mode": False,
+                    "cache_enabled": True,
+                    "max_file_size": 1048576,  # 1MB
+                    "timeout": 30,
+                    "collect_suggestions": True,
+                },
+                id="validator",
+            ),
+            pytest.param(
+                EmbeddingConfig,
+                {"model": "all-MiniLM-L6-v2", "dimension": 384, "batch_size": 32},
+                id="embedding",
+            ),
+            pytest.param(
+                IndexingConfig,
+                {
+                    "chunk_size": 512,
+                    "chunk_overlap": 50,
+                    "doc_types": ["api", "guide", "example", "css_reference"],
+                },
+                id="indexing",
+            ),
+            pytest.param(
+                SearchConfig,
+                {
+                    "auto_index": True,
+                    "embeddings_model": "BAAI/bge-base-en-v1.5",
+                    "persist_path": "./data/textual_docs.db",
+                    "chunk_size": 200,
+                    "chunk_overlap": 20,
+                    "github_token": None,
+                    "default_limit": 10,
+                    "similarity_threshold": 0.7,
+                },
+                id="search",
+            ),
+            pytest.param(
+                PerformanceConfig,
+                {"cache_size": 100, "timeout": 30, "max_concurrent_requests": 10},
+                id="performance",
+            ),
+            pytest.param(
+                LoggingConfig,
+                {"level": "INFO", "format": "json", "file": "textual-mcp.log"},
+                id="logging",
+            ),
+            pytest.param(
+                FeaturesConfig,
+                {"experimental": False, "plugins_enabled": True},
+                id="features",
+            ),
+        ],
+    )
+    def test_config_defaults(self, config_class: type, expected: Dict[str, Any]):
+        """Test each config section's default values."""
+        config = config_class()
+
+        assert {name: getattr(config, name) for name in expected} == expected
 
     def test_search_config_persistence(self):
         """Test SearchConfig persist_path configuration."""
@@ -74,32 +154,9 @@ class TestConfigClasses:
         config = SearchConfig(persist_path=None)
         assert config.persist_path is None
 
-    def test_performance_config_defaults(self):
-        """Test PerformanceConfig default values."""
-        config = PerformanceConfig()
-
-        assert config.cache_size == 100
-        assert config.timeout == 30
-        assert config.max_concurrent_requests == 10
-
-    def test_logging_config_defaults(self):
-        """Test LoggingConfig default values."""
-        config = LoggingConfig()
-
-        assert config.level == "INFO"
-        assert config.format == "json"
-        assert config.file == "textual-mcp.log"
-
-    def test_features_config_defaults(self):
-        """Test FeaturesConfig default values."""
-        config = FeaturesConfig()
-
-        assert config.experimental is False
-        assert config.plugins_enabled is True
-
     def test_textual_mcp_config_defaults(self):
         """Test TextualMCPConfig default values."""
-        config = TextualMCPConfig()
+        config = DEFAULT_CONFIG
 
         assert isinstance(config.validators, ValidatorConfig)
         assert isinstance(config.search, SearchConfig)
@@ -126,20 +183,8 @@ class TestConfigLoading:
 
     def test_load_config_from_file(self, temp_dir: Path):
         """Test loading configuration from YAML file."""
-        config_data = {
-            "validators": {
-                "strict_mode": True,
-                "cache_enabled": False,
-            },
-            "logging": {
-                "level": "DEBUG",
-                "file": "custom.log",
-            },
-        }
-
         config_file = temp_dir / "test_config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_text(BASIC_CONFIG_YAML)
 
         config = load_config(str(config_file))
 
@@ -163,15 +208,8 @@ class TestConfigLoading:
 
     def test_load_config_invalid_values(self, temp_dir: Path):
         """Test loading configuration with invalid values."""
-        config_data = {
-            "validators": {
-                "max_file_size": "not_a_number",
-            },
-        }
-
         config_file = temp_dir / "bad_config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_text(BAD_NUMBER_CONFIG_YAML)
 
         with pytest.raises(ValueError) as exc_info:
             load_config(str(config_file))
@@ -180,19 +218,8 @@ class TestConfigLoading:
 
     def test_load_config_with_env_overrides(self, temp_dir: Path):
         """Test loading configuration with environment variable overrides."""
-        config_data = {
-            "search": {
-                "persist_path": "./original/path.db",
-                "embeddings_model": "original-model",
-            },
-            "logging": {
-                "level": "INFO",
-            },
-        }
-
         config_file = temp_dir / "config.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        config_file.write_text(ENV_OVERRIDE_CONFIG_YAML)
 
         # Set environment variables
         env_vars = {
@@ -214,66 +241,57 @@ class TestConfigLoading:
 class TestEnvironmentOverrides:
     """Test environment variable override functionality."""
 
-    def test_get_env_overrides_empty(self):
-        """Test getting overrides with no environment variables set."""
-        with patch.dict(os.environ, {}, clear=True):
-            overrides = _get_env_overrides()
-            assert overrides == {}
-
-    def test_get_env_overrides_search(self):
-        """Test search environment overrides."""
-        env_vars = {
-            "EMBEDDINGS_STORE": "/test/embeddings.db",
-            "EMBEDDINGS_MODEL": "test-model",
-            "GITHUB_TOKEN": "test-github-token",
-        }
-
-        with patch.dict(os.environ, env_vars):
-            overrides = _get_env_overrides()
-
-        assert overrides["search"]["persist_path"] == "/test/embeddings.db"
-        assert overrides["search"]["embeddings_model"] == "test-model"
-        assert overrides["search"]["github_token"] == "test-github-token"
-
-    def test_get_env_overrides_logging(self):
-        """Test logging environment overrides."""
-        env_vars = {
-            "LOG_LEVEL": "ERROR",
-            "LOG_FILE": "/var/log/test.log",
-        }
-
-        with patch.dict(os.environ, env_vars):
-            overrides = _get_env_overrides()
-
-        assert overrides["logging"]["level"] == "ERROR"
-        assert overrides["logging"]["file"] == "/var/log/test.log"
-
-    def test_get_env_overrides_performance(self):
-        """Test performance environment overrides."""
-        env_vars = {
-            "CACHE_SIZE": "500",
-            "MAX_CONCURRENT_REQUESTS": "20",
-        }
-
-        with patch.dict(os.environ, env_vars):
-            overrides = _get_env_overrides()
-
-        assert overrides["performance"]["cache_size"] == 500
-        assert overrides["performance"]["max_concurrent_requests"] == 20
-
-    def test_get_env_overrides_invalid_numbers(self):
-        """Test handling of invalid numeric environment values."""
-        env_vars = {
-            "CACHE_SIZE": "not_a_number",
-            "MAX_CONCURRENT_REQUESTS": "invalid",
-        }
-
-        with patch.dict(os.environ, env_vars):
-            overrides = _get_env_overrides()
-
-        # Invalid values should be ignored
-        assert "cache_size" not in overrides.get("performance", {})
-        assert "max_concurrent_requests" not in overrides.get("performance", {})
+    @pytest.mark.parametrize(
+        "env_vars, expected",
+        [
+            pytest.param({}, {}, id="empty"),
+            pytest.param(
+                {
+                    "EMBEDDINGS_STORE": "/test/embeddings.db",
+                    "EMBEDDINGS_MODEL": "test-model",
+                    "GITHUB_TOKEN": "test-github-token",
+                },
+                {
+                    "search": {
+                        "persist_path": "/test/embeddings.db",
+                        "embeddings_model": "test-model",
+                        "github_token": "test-github-token",
+                    }
+                },
+                id="search",
+            ),
+            pytest.param(
+                {"LOG_LEVEL": "ERROR", "LOG_FILE": "/var/log/test.log"},
+                {"logging": {"level": "ERROR", "file": "/var/log/test.log"}},
+                id="logging",
+            ),
+            pytest.param(
+                {"CACHE_SIZE": "500", "MAX_CONCURRENT_REQUESTS": "20"},
+                {"performance": {"cache_size": 500, "max_concurrent_requests": 20}},
+                id="performance",
+            ),
+            # Invalid numeric values should be ignored
+            pytest.param(
+                {"CACHE_SIZE": "not_a_number", "MAX_CONCURRENT_REQUESTS": "invalid"},
+                {},
+                id="invalid_numbers",
+            ),
+        ],
+    )
+    def test_get_env_overrides(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env_vars: Dict[str, str],
+        expected: Dict[str, Any],
+    ):
+        """Test the overrides read from each group of environment variables."""
+        # Only the variables under test may be set, including LOG_LEVEL from the test session
+        for name in OVERRIDE_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
+
+        assert _get_env_overrides() == expected
 
 
 class TestDeepUpdate:
@@ -336,43 +354,52 @@ class TestDeepUpdate:
 class TestConfigPath:
     """Test configuration path resolution."""
 
-    def test_get_default_config_path_current_dir(self, temp_dir: Path):
+    def test_get_default_config_path_current_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test finding config in current directory."""
-        with patch("pathlib.Path.cwd", return_value=temp_dir):
-            # Create config file in current dir
-            config_file = temp_dir / "textual-mcp.yaml"
-            config_file.touch()
+        monkeypatch.chdir(tmp_path)
+        # Create config file in current dir
+        config_file = tmp_path / "textual-mcp.yaml"
+        config_file.touch()
 
-            path = get_default_config_path()
-            assert path == config_file
+        path = get_default_config_path()
+        assert path == config_file
 
-    def test_get_default_config_path_yml_extension(self, temp_dir: Path):
+    def test_get_default_config_path_yml_extension(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test finding config with .yml extension."""
-        with patch("pathlib.Path.cwd", return_value=temp_dir):
-            # Create config file with .yml extension
-            config_file = temp_dir / "textual-mcp.yml"
-            config_file.touch()
+        monkeypatch.chdir(tmp_path)
+        # Create config file with .yml extension
+        config_file = tmp_path / "textual-mcp.yml"
+        config_file.touch()
 
-            path = get_default_config_path()
-            assert path == config_file
+        path = get_default_config_path()
+        assert path == config_file
 
-    def test_get_default_config_path_config_dir(self, temp_dir: Path):
+    def test_get_default_config_path_config_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test finding config in config subdirectory."""
-        with patch("pathlib.Path.cwd", return_value=temp_dir):
-            # Create config directory and file
-            config_dir = temp_dir / "config"
-            config_dir.mkdir()
-            config_file = config_dir / "textual-mcp.yaml"
-            config_file.touch()
-
-            path = get_default_config_path()
-            assert path == config_file
-
-    def test_get_default_config_path_not_found(self, temp_dir: Path):
+        monkeypatch.chdir(tmp_path)
+        # Create config directory and file
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        config_file = config_dir / "textual-mcp.yaml"
+        config_file.touch()
+
+        path = get_default_config_path()
+        assert path == config_file
+
+    def test_get_default_config_path_not_found(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test default path when no config file exists."""
-        with patch("pathlib.Path.cwd", return_value=temp_dir):
-            path = get_default_config_path()
-            assert path == temp_dir / "config" / "textual-mcp.yaml"
+        monkeypatch.chdir(tmp_path)
+
+        path = get_default_config_path()
+        assert path == tmp_path / "config" / "textual-mcp.yaml"
 
 
 class TestSaveConfig:
@@ -380,7 +407,7 @@ class TestSaveConfig:
 
     def test_save_config_default_path(self, temp_dir: Path):
         """Test saving configuration to default path."""
-        config = TextualMCPConfig()
+        config = DEFAULT_CONFIG
 
         with patch("textual_mcp.config.get_default_config_path") as mock_path:
             save_path = temp_dir / "config" / "test.yaml"
@@ -392,7 +419,7 @@ class TestSaveConfig:
 
             # Load and verify
             with open(save_path) as f:
-                saved_data = yaml.safe_load(f)
+                saved_data = yaml.load(f, Loader=YAML_LOADER)
 
             assert saved_data["validators"]["strict_mode"] is False
             assert saved_data["logging"]["level"] == "INFO"
@@ -411,14 +438,14 @@ class TestSaveConfig:
 
         # Load and verify
         with open(save_path) as f:
-            saved_data = yaml.safe_load(f)
+            saved_data = yaml.load(f, Loader=YAML_LOADER)
 
         assert saved_data["validators"]["strict_mode"] is True
         assert saved_data["logging"]["level"] == "DEBUG"
 
     def test_save_config_creates_directory(self, temp_dir: Path):
         """Test that save_config creates parent directories."""
-        config = TextualMCPConfig()
+        config = DEFAULT_CONFIG
 
         save_path = temp_dir / "nested" / "dirs" / "config.yaml"
         save_config(config, str(save_path))
@@ -3,6 +3,7 @@
 from textual_mcp.validators.conflict_detector import (
     ConflictDetector,
     SelectorOverlapAnalyzer,
+    SelectorParts,
     PropertyConflictDetector,
     ConflictResolutionSuggester,
     StyleConflict,
@@ -54,6 +55,28 @@ class TestSelectorOverlapAnalyzer:
         result = analyzer.analyze_overlap("#main.active", "#main.inactive")
         assert result == "partial"
 
+    def test_parse_selector_parts(self):
+        """Test parsing a selector into its component parts."""
+        analyzer = SelectorOverlapAnalyzer()
+
+        parts = analyzer._parse_selector_parts("#main Button.primary:hover::before")
+
+        assert isinstance(parts, SelectorParts)
+        assert parts.ids == {"main"}
+        assert parts.types == {"Button"}
+        assert parts.classes == {"primary"}
+        assert parts.pseudos == {"hover"}
+        assert parts.attributes == frozenset()
+        # Parse results are immutable and hashable
+        assert hash(parts) == hash(analyzer._parse_selector_parts("#main Button.primary:hover"))
+
+    def test_selector_parts_shared_across_analyzers(self):
+        """Test that parsed selector parts are cached for the whole process."""
+        first = SelectorOverlapAnalyzer()._parse_selector_parts("Button.primary")
+        second = SelectorOverlapAnalyzer()._parse_selector_parts("Button.primary")
+
+        assert first is second
+
     def test_specificity_calculation(self):
         """Test CSS specificity calculation."""
         analyzer = SelectorOverlapAnalyzer()
@@ -332,6 +355,66 @@ class TestConflictDetector:
         assert button_overlap is not None
         assert button_overlap.overlap_type == "exact"
 
+    def test_analyze_identical_duplicate_rules(self):
+        """Test that identical rule blocks are reported as exact duplicates."""
+        detector = ConflictDetector()
+
+        css = """
+        Button {
+            color: red;
+            background: blue;
+        }
+
+        Button {
+            color: red;
+            background: blue;
+        }
+        """
+
+        result = detector.analyze_conflicts(css)
+
+        assert len(result.conflicts) == 1
+        conflict = result.conflicts[0]
+        assert conflict.selector1 == conflict.selector2 == "Button"
+        assert conflict.conflicting_properties == ["background", "color"]
+        assert "duplicates" in conflict.resolution_suggestion
+        assert conflict.exact_duplicate
+        assert result.property_conflicts == {}
+
+        button_overlap = next(
+            (o for o in result.overlapping_selectors if "Button" in o.selectors), None
+        )
+        assert button_overlap is not None
+        assert button_overlap.overlap_type == "exact"
+        assert len(button_overlap.selectors) == 2
+
+    def test_analyze_repeated_rule_with_rule_in_between(self):
+        """Test that a repeated block is not a duplicate when another block sits between."""
+        detector = ConflictDetector()
+
+        css = """
+        Button {
+            color: red;
+        }
+
+        Button {
+            color: blue;
+        }
+
+        Button {
+            color: red;
+        }
+        """
+
+        result = detector.analyze_conflicts(css)
+
+        assert not any(conflict.exact_duplicate for conflict in result.conflicts)
+        # The first and last blocks agree; each of them conflicts with the middle one,
+        # including the pair that decides the final value
+        assert len(result.conflicts) == 2
+        assert all(conflict.conflicting_properties == ["color"] for conflict in result.conflicts)
+        assert "colors" in result.property_conflicts
+
     def test_analyze_complex_conflicts(self):
         """Test analysis of complex CSS with multiple conflict types."""
         detector = ConflictDetector()
@@ -234,6 +234,15 @@ class TestInlineValidator:
         assert result.valid is True
         assert len(result.warnings) == 0
 
+    def test_duplicate_declarations_warn_once_per_property(self):
+        """Test duplicate detection on already-parsed declaration names."""
+        warnings = []
+        self.validator._validate_declarations(
+            ["color", "margin", "color", "color"], "color: red;", warnings
+        )
+
+        assert [w.property_name for w in warnings] == ["color"]
+
     def test_error_recovery(self):
         """Test error recovery in parsing."""
         # Invalid syntax that should produce errors
@@ -0,0 +1,127 @@
+"""Tests for CSS property validator."""
+
+from textual_mcp.validators.property_validator import (
+    TextualPropertyValidator,
+    PropertyValidationError,
+)
+
+
+class TestTextualPropertyValidator:
+    """Test cases for property validator."""
+
+    def test_valid_properties(self):
+        """Test validation of valid property values."""
+        validator = TextualPropertyValidator()
+
+        assert validator.validate_property("color", "red") is None
+        assert validator.validate_property("background", "#1e1e1e") is None
+        assert validator.validate_property("width", "50%") is None
+        assert validator.validate_property("margin", "1 2") is None
+        assert validator.validate_property("text-style", "bold italic") is None
+
+    def test_unknown_property(self):
+        """Test validation of unknown properties."""
+        validator = TextualPropertyValidator()
+
+        error = validator.validate_property("gap", "1", line=3)
+        assert isinstance(error, PropertyValidationError)
+        assert "Invalid CSS property" in error.message
+        assert error.line == 3
+
+        error = validator.validate_property("foo", "bar")
+        assert error is not None
+        assert "Unknown CSS property" in error.message
+
+    def test_invalid_values(self):
+        """Test validation of invalid property values."""
+        validator = TextualPropertyValidator()
+
+        assert validator.validate_property("margin", "1 2 3") is not None
+        assert validator.validate_property("padding", "10%") is not None
+        assert validator.validate_property("width", "abc") is not None
+        assert validator.validate_property("color", "notacolor") is not None
+        assert validator.validate_property("dock", "middle") is not None
+
+    def test_cached_errors_carry_their_own_line(self):
+        """Test that cached value errors are reported with the caller's line."""
+        validator = TextualPropertyValidator()
+
+        first = validator.validate_property("width", "abc", line=1)
+        second = validator.validate_property("width", "abc", line=5)
+
+        assert first is not None and second is not None
+        assert first is not second
+        assert first.line == 1
+        assert second.line == 5
+        assert first.message == second.message
+
+    def test_validate_css_content(self):
+        """Test validation of properties in CSS content."""
+        validator = TextualPropertyValidator()
+
+        css = """
+Button {
+    color: red;
+    width: abc;
+    gap: 1;
+}
+"""
+        errors = validator.validate_css_content(css)
+
+        assert [(e.property_name, e.line) for e in errors] == [("width", 4), ("gap", 5)]
+
+    def test_is_valid_integer(self):
+        """Test integer detection for spacing and integer-only values."""
+        validator = TextualPropertyValidator()
+
+        for value in ("0", "12", "-3", "+4"):
+            assert validator._is_valid_integer(value)
+        for value in ("", "-", "1.5", "1_000", "²", "1e3", "abc"):
+            assert not validator._is_valid_integer(value)
+
+    def test_dimension_units(self):
+        """Test dimension values with each supported unit."""
+        validator = TextualPropertyValidator()
+
+        for value in ("auto", "10", "50%", "2fr", "1.5fr", "100vh", "50vw", "10vmin", "10vmax"):
+            assert validator.validate_property("width", value) is None
+        for value in ("fr", "abc%", "10px", "vmin"):
+            assert validator.validate_property("width", value) is not None
+
+    def test_parallel_validation_matches_serial(self, two_cpus):
+        """Test that process-pool CSS validation keeps errors and line numbers."""
+        css = "\n".join(["Button {", "    color: red;", "    width: abc;", "    gap: 1;", "}"] * 5)
+
+        serial = TextualPropertyValidator().validate_css_content(css)
+        parallel = TextualPropertyValidator(parallel_threshold=0).validate_css_content(css)
+
+        assert len(serial) == 10
+        assert parallel == serial
+
+    def test_validate_css_content_skips_rule_headers(self):
+        """Test that selector lines containing a colon are not read as declarations."""
+        validator = TextualPropertyValidator()
+
+        css = """
+button:hover {
+    width: abc;
+}
+"""
+        errors = validator.validate_css_content(css)
+
+        assert [(e.property_name, e.line) for e in errors] == [("width", 3)]
+
+    def test_validate_css_content_skips_multiline_comments(self):
+        """Test that declarations inside multi-line comments are not validated."""
+        validator = TextualPropertyValidator()
+
+        css = """Button {
+    /* width: abc;
+       gap: 1; */
+    color: /* inline */ notacolor;
+    dock: middle;
+}
+"""
+        errors = validator.validate_css_content(css)
+
+        assert [(e.property_name, e.line) for e in errors] == [("color", 4), ("dock", 5)]
@@ -1,8 +1,12 @@
 """Tests for CSS selector validator."""
 
+import os
+
+from textual_mcp.utils.parallel import get_process_pool
 from textual_mcp.validators.selector_validator import (
     SelectorValidator,
     SelectorValidationResult,
+    get_selector_validator,
 )
 
 
@@ -279,6 +283,11 @@ class TestSelectorValidator:
                 assert isinstance(result.specificity, tuple)
                 assert len(result.specificity) == 3
 
+    def test_pseudo_class_names_are_not_type_selectors(self):
+        """Test that Textual pseudo-class names don't count towards type specificity."""
+        for selector in ("Button:hover", "Button:disabled", "ListItem:odd", "Input:focus-within"):
+            assert self.validator._calculate_specificity(selector) == (0, 1, 1)
+
     def test_selector_components(self):
         """Test parsing of selector components."""
         # Test with a simpler selector that Textual supports
@@ -347,3 +356,45 @@ class TestSelectorValidator:
             result = self.validator.validate_selector(selector)
             # Should handle escaped characters properly
             assert isinstance(result, SelectorValidationResult)
+
+    def test_repeated_selector_uses_cache(self):
+        """Test that validating the same selector twice reuses the result."""
+        first = self.validator.validate_selector("Button.primary")
+        second = self.validator.validate_selector("Button.primary")
+
+        assert first is second
+        assert self.validator.validate_selector("Label") is not first
+
+    def test_lowercase_type_selector_reports_pascal_case(self):
+        """Test that bare lowercase widget names get the PascalCase error."""
+        result = self.validator.validate_selector("button")
+
+        assert result.valid is False
+        assert result.selector_type == "type"
+        assert "PascalCase" in result.error
+
+    def test_parallel_validation_matches_serial(self, two_cpus):
+        """Test that process-pool selector validation gives the same results in order."""
+        selectors = ["Button", "button", ".row", "#main", "Screen > Button", "Label:hover"] * 3
+
+        serial = SelectorValidator().validate_selectors(selectors)
+        validator = SelectorValidator(parallel_threshold=0)
+        parallel = validator.validate_selectors(selectors)
+
+        assert parallel == serial
+        # Pool results are moved into the validator's own cache
+        assert validator._validate_selector_cached.cache_info().currsize == 6
+        assert validator._pool_results == {}
+
+    def test_parallel_validation_skipped_on_one_cpu(self, monkeypatch):
+        """Test that a single usable CPU never starts a process pool."""
+        monkeypatch.setattr(os, "process_cpu_count", lambda: 1, raising=False)
+
+        assert get_process_pool() is None
+        results = SelectorValidator(parallel_threshold=0).validate_selectors(["Button", ".row"])
+        assert all(result.valid for result in results)
+
+    def test_shared_validator_instance(self):
+        """Test that the shared validator is created once and reused."""
+        assert isinstance(get_selector_validator(), SelectorValidator)
+        assert get_selector_validator() is get_selector_validator()
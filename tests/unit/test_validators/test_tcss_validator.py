@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from textual_mcp.config import ValidatorConfig
 from textual_mcp.validators.tcss_validator import TCSSValidator, ValidationResult
 from textual_mcp.utils.errors import ValidationError
 
@@ -61,6 +62,42 @@ class TestTCSSValidator:
         assert len(result.errors) == 1
         assert "not found" in result.errors[0].message.lower()
 
+    def test_validate_files(self, tcss_validator: TCSSValidator, tmp_path: Path):
+        """Test validating several files at once keeps results in path order."""
+        valid_file = tmp_path / "valid.tcss"
+        valid_file.write_text("Button {\n    color: red;\n}\n")
+        invalid_file = tmp_path / "invalid.tcss"
+        invalid_file.write_text("Button {\n    width: abc;\n}\n")
+
+        results = tcss_validator.validate_files(
+            [str(valid_file), str(tmp_path / "nonexistent.tcss"), str(invalid_file)]
+        )
+
+        assert [result.valid for result in results] == [True, False, False]
+        assert "not found" in results[1].errors[0].message.lower()
+        assert results[2].errors[0].property_name == "width"
+        assert tcss_validator.validate_files([]) == []
+
+    def test_parallel_validate_files_matches_serial(self, test_config, tmp_path: Path, two_cpus):
+        """Test that process-pool file validation returns the serial results in order."""
+        paths = []
+        for index, css in enumerate(
+            ["Button {\n    color: red;\n}\n", "Button {\n    width: abc;\n}\n"] * 2
+        ):
+            path = tmp_path / f"file{index}.tcss"
+            path.write_text(css)
+            paths.append(str(path))
+        paths.append(str(tmp_path / "nonexistent.tcss"))
+
+        serial = TCSSValidator(test_config.validators).validate_files(paths)
+        parallel = TCSSValidator(test_config.validators, parallel_threshold=0).validate_files(paths)
+
+        assert [result.valid for result in parallel] == [True, False, True, False, False]
+        assert [result.summary for result in parallel] == [result.summary for result in serial]
+        assert [[e.message for e in result.errors] for result in parallel] == [
+            [e.message for e in result.errors] for result in serial
+        ]
+
     def test_validate_large_css_file_limit(self, tcss_validator: TCSSValidator):
         """Test validation with file size limit."""
         # Create CSS content larger than the limit
@@ -72,6 +109,42 @@ class TestTCSSValidator:
             assert result.valid is False
             assert any("exceeds maximum size" in error.message for error in result.errors)
 
+    def test_cached_results_are_independent_copies(self):
+        """Test that repeated validation of the same content reuses a cached result safely."""
+        validator = TCSSValidator(ValidatorConfig(cache_enabled=True))
+        css = "Button {\n    color: red\n}"
+
+        first = validator.validate(css)
+        first.warnings.clear()
+        second = validator.validate(css)
+
+        assert second.warnings
+        assert second.summary == first.summary
+        assert second.rule_count == first.rule_count
+
+    def test_stylesheet_checks(self, tcss_validator: TCSSValidator):
+        """Test duplicate, specificity and empty-rule checks on parsed rules."""
+        css = """
+Button { color: red; }
+Label, Button { width: 10; }
+#a #b #c { height: 1; }
+Static {}
+"""
+        result = tcss_validator.validate(css)
+        messages = [warning.message for warning in result.warnings]
+
+        assert result.rule_count == 4
+        assert result.selector_count == 5
+        assert messages == [
+            "Duplicate selector: Button",
+            "Selector has high ID specificity: #a #b #c",
+            "Empty rule for selector: Static",
+        ]
+
+        # A nesting parent is parsed as an empty rule of its own, but it is not empty
+        nested = tcss_validator.validate("Screen {\n  Button { color: red; }\n}\n")
+        assert not any(warning.message.startswith("Empty rule") for warning in nested.warnings)
+
     def test_strict_mode_toggle(self, tcss_validator: TCSSValidator, sample_css: str):
         """Test strict mode functionality."""
         # Test with strict mode off
@@ -86,6 +159,21 @@ class TestTCSSValidator:
         assert result_normal.valid is True
         assert result_strict.valid is True
 
+    def test_collect_suggestions_toggle(self):
+        """Test that semantic checks only run outside strict mode when enabled."""
+        css = "Button {\n    color: #ffffff\n}\n"
+
+        collected = TCSSValidator(ValidatorConfig(cache_enabled=False)).validate(css)
+        validator = TCSSValidator(ValidatorConfig(cache_enabled=False, collect_suggestions=False))
+        skipped = validator.validate(css)
+        validator.strict_mode = True
+        strict = validator.validate(css)
+
+        assert collected.suggestions and collected.warnings
+        assert skipped.suggestions == [] and skipped.warnings == []
+        assert skipped.valid == collected.valid
+        assert strict.suggestions == collected.suggestions
+
     def test_css_with_variables(self, tcss_validator: TCSSValidator):
         """Test CSS with Textual variables."""
         css_with_vars = """